@@ -1,12 +1,13 @@
 #!/usr/bin/env python3
 """Pipeline runner for dataspine."""
 
-import argparse
 import sys
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     """Main entry point for pipeline runner."""
+    import argparse
+
     parser = argparse.ArgumentParser(description="Run dataspine pipeline")
 
     parser.add_argument(
@@ -25,6 +26,7 @@ def main() -> int:
         action="store_true",
         help="Print what would run without executing"
     )
+
     parser.add_argument(
         "--start",
         type=str,
@@ -36,22 +38,26 @@ def main() -> int:
         help="End date for backfill (YYYY-MM-DD)"
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Print what would run
-    print("Pipeline Configuration:")
-    print(f"  Mode: {args.mode}")
-    print(f"  Client: {args.client or 'all'}")
-    print(f"  Dry Run: {args.dry_run}")
+    lines = [
+        "Pipeline Configuration:",
+        f"  Mode: {args.mode}",
+        f"  Client: {args.client or 'all'}",
+        f"  Dry Run: {args.dry_run}",
+    ]
 
     if args.mode == "backfill":
-        print(f"  Start Date: {args.start or 'not specified'}")
-        print(f"  End Date: {args.end or 'not specified'}")
+        lines.append(f"  Start Date: {args.start or 'not specified'}")
+        lines.append(f"  End Date: {args.end or 'not specified'}")
 
     if args.dry_run:
-        print("\n[DRY RUN] No actual operations performed.")
+        lines.append("\n[DRY RUN] No actual operations performed.")
     else:
-        print("\n[INFO] Pipeline execution would start here.")
+        lines.append("\n[INFO] Pipeline execution would start here.")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
     return 0
 
@@ -2,45 +2,66 @@
 
 import os
 import sys
-from typing import Any
+from dataclasses import dataclass
+from functools import lru_cache
 
 from dotenv import load_dotenv
 
+REQUIRED_VARS = (
+    "DB_HOST",
+    "DB_PORT",
+    "DB_NAME",
+    "DB_USER",
+    "DB_PASS",
+)
 
-def load_config() -> dict[str, Any]:
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Immutable application configuration loaded from the environment."""
+
+    db_host: str
+    db_port: int
+    db_name: str
+    db_user: str
+    db_pass: str
+    log_level: str
+    app_env: str
+
+
+@lru_cache(maxsize=1)
+def load_config() -> Config:
     """
     Load configuration from environment variables.
 
+    The result is cached for the lifetime of the process; call
+    load_config.cache_clear() to force a reload. Set DATASPINE_SKIP_DOTENV
+    to skip reading .env when the environment is already populated
+    (e.g. in containers).
+
     Raises:
         SystemExit: If required environment variables are missing.
 
     Returns:
-        Dict containing configuration values.
+        Config containing configuration values.
     """
-    load_dotenv()
+    getenv = os.environ.get
 
-    required_vars = [
-        "DB_HOST",
-        "DB_PORT",
-        "DB_NAME",
-        "DB_USER",
-        "DB_PASS",
-    ]
+    if not getenv("DATASPINE_SKIP_DOTENV"):
+        load_dotenv()
 
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
+    missing_vars = [var for var in REQUIRED_VARS if not getenv(var)]
 
     if missing_vars:
         print(f"ERROR: Missing required environment variables: {', '.join(missing_vars)}", file=sys.stderr)
         sys.exit(1)
 
-    config = {
-        "db_host": os.getenv("DB_HOST"),
-        "db_port": int(os.getenv("DB_PORT", "5432")),
-        "db_name": os.getenv("DB_NAME"),
-        "db_user": os.getenv("DB_USER"),
-        "db_pass": os.getenv("DB_PASS"),
-        "log_level": os.getenv("LOG_LEVEL", "INFO"),
-        "app_env": os.getenv("APP_ENV", "development"),
-    }
-
-    return config
+    return Config(
+        db_host=getenv("DB_HOST"),
+        db_port=int(getenv("DB_PORT", "5432")),
+        db_name=getenv("DB_NAME"),
+        db_user=getenv("DB_USER"),
+        db_pass=getenv("DB_PASS"),
+        log_level=getenv("LOG_LEVEL", "INFO"),
+        app_env=getenv("APP_ENV", "development"),
+    )
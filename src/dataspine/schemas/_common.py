@@ -0,0 +1,284 @@
+"""
+Shared field types for dataspine schemas.
+
+This module holds the constrained field types and validation constants that
+MarketData and TradeData have in common, so both models are built from the
+same definitions instead of duplicated validators.
+
+Types:
+    - Symbol: Uppercase ticker, 1-10 chars, alphanumeric + period
+    - Price: Positive Decimal with at most 4 decimal places
+    - UtcTimestamp: Timezone-aware UTC datetime, not >5min future, not before 2000
+    - NonEmptyStr: String containing at least one non-whitespace character
+    - CategoryStr: NonEmptyStr for low-cardinality values (source, venue)
+
+Symbol and CategoryStr values are interned: every occurrence of the same
+value shares one str object (up to _INTERN_MAX distinct values), and
+symbols get a stable int id (symbol_id).
+
+Prices and quantities carry at most 4 decimal places, so they also have an
+exact fixed-point form: an int scaled by 10_000 (see to_e4/from_e4).
+decimal_places() counts them from the exponent, so trailing zeros count.
+
+fingerprint() backs the models' content_hash: a 64-bit digest of the JSON
+form, cheap to store and compare across pipeline runs.
+"""
+
+import hashlib
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Annotated
+
+from pydantic import AfterValidator, Field, StringConstraints, ValidationInfo
+
+# Constants for validation
+SYMBOL_PATTERN = re.compile(r'^[A-Z0-9.]{1,10}$')
+MAX_DECIMAL_PLACES = 4
+FIXED_POINT_SCALE = 10 ** MAX_DECIMAL_PLACES
+MAX_FUTURE_MINUTES = 5
+MIN_VALID_YEAR = 2000
+NON_BLANK_PATTERN = r"\S"
+
+_SYMBOL_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.")
+
+_MAX_FUTURE_DELTA = timedelta(minutes=MAX_FUTURE_MINUTES)
+_ZERO_DELTA = timedelta(0)
+_UTC = timezone.utc
+
+_MIN_VALID_TS = datetime(MIN_VALID_YEAR, 1, 1, tzinfo=_UTC)
+
+# Cached future bound for the timestamp validator: (monotonic_ns at refresh, now + 5min).
+# Published as one tuple so a concurrent reader never sees a half-updated pair;
+# the seed is stale, so its bound is never returned.
+_NOW_CACHE_TTL_NS = 50_000_000  # 50ms
+_max_future_cache: tuple[int, datetime] = (-_NOW_CACHE_TTL_NS, _MIN_VALID_TS)
+
+
+def _max_future_cached() -> datetime:
+    """
+    Return the latest acceptable timestamp (now + 5min), refreshed at most every 50ms.
+
+    Avoids a clock read and two datetime allocations per validated row.
+    """
+    global _max_future_cache
+    refreshed_ns, bound = _max_future_cache
+    now_ns = time.monotonic_ns()
+    if now_ns - refreshed_ns >= _NOW_CACHE_TTL_NS:
+        bound = datetime.now(_UTC) + _MAX_FUTURE_DELTA
+        _max_future_cache = (now_ns, bound)
+    return bound
+
+
+# Canonical str per unique symbol/source/venue value, and symbol -> int id.
+# The intern table is capped so a feed of ever-new values can't grow it
+# without bound; values first seen once it is full are not interned.
+_INTERN_MAX = 65_536
+_INTERN_TABLE: dict[str, str] = {}
+_SYMBOL_IDS: dict[str, int] = {}
+_SYMBOL_IDS_LOCK = threading.Lock()
+
+
+def _intern(v: str) -> str:
+    """Return the canonical str object for v, registering it on first sight while not full."""
+    canonical = _INTERN_TABLE.get(v)
+    if canonical is None:
+        if len(_INTERN_TABLE) >= _INTERN_MAX:
+            return v
+        canonical = _INTERN_TABLE.setdefault(v, v)
+    return canonical
+
+
+def symbol_id(symbol: str) -> int:
+    """
+    Return a stable int id for a symbol, assigning the next id on first use.
+
+    Ids are dense (0, 1, 2, ...) within a process, so they can index
+    column arrays keyed by symbol.
+
+    Args:
+        symbol: Ticker symbol.
+
+    Returns:
+        The symbol's int id.
+    """
+    sid = _SYMBOL_IDS.get(symbol)
+    if sid is None:
+        with _SYMBOL_IDS_LOCK:
+            sid = _SYMBOL_IDS.setdefault(symbol, len(_SYMBOL_IDS))
+    return sid
+
+
+def is_valid_symbol(v: str) -> bool:
+    """
+    Check a symbol against the SYMBOL_FORMAT contract.
+
+    Equivalent to SYMBOL_PATTERN.fullmatch(v), but a length check plus a
+    frozenset scan is cheaper than a regex call on 1-10 character strings.
+    It also beats a 256-entry byte table applied with bytes.translate: the
+    encode() allocation costs more than it saves on strings this short.
+
+    Args:
+        v: The symbol string to check.
+
+    Returns:
+        True if the symbol is 1-10 chars of A-Z, 0-9 or period.
+    """
+    return 0 < len(v) <= 10 and _SYMBOL_CHARS.issuperset(v)
+
+
+def decimal_places(value: Decimal) -> int:
+    """
+    Count the decimal places of a finite Decimal as written, trailing zeros included.
+
+    Read from the exponent alone, so the cost doesn't depend on the value:
+    "1E-10000000" is as cheap as "0.5", and values longer than 28 digits
+    are counted exactly (no context rounding).
+
+    Args:
+        value: Finite Decimal.
+
+    Returns:
+        Number of digits after the decimal point.
+    """
+    return max(-value.as_tuple().exponent, 0)
+
+
+def exceeds_decimal_places(value: Decimal) -> bool:
+    """Check a finite Decimal for more than MAX_DECIMAL_PLACES decimal places (exponent < -4)."""
+    return value.as_tuple().exponent < -MAX_DECIMAL_PLACES
+
+
+def to_e4(value: Decimal) -> int:
+    """
+    Convert a validated price or quantity to fixed-point int (x 10_000).
+
+    Exact for values with at most 4 decimal places, which the Price type
+    guarantees. Use for aggregations (sums, VWAP) that should run on ints.
+
+    Args:
+        value: Decimal with at most 4 decimal places.
+
+    Returns:
+        value * 10_000 as an int.
+    """
+    return int(value.scaleb(MAX_DECIMAL_PLACES))
+
+
+def from_e4(value: int) -> Decimal:
+    """
+    Convert a fixed-point int (x 10_000) back to a Decimal.
+
+    Args:
+        value: Price or quantity scaled by 10_000.
+
+    Returns:
+        Decimal with 4 decimal places.
+    """
+    return Decimal(value).scaleb(-MAX_DECIMAL_PLACES)
+
+
+def fingerprint(payload: bytes) -> int:
+    """
+    Return a 64-bit content fingerprint (blake2b) of serialized record bytes.
+
+    Args:
+        payload: Serialized record, e.g. from to_json().
+
+    Returns:
+        Unsigned 64-bit int.
+    """
+    return int.from_bytes(hashlib.blake2b(payload, digest_size=8).digest(), "big")
+
+
+def _validate_decimal_places(v: Decimal, info: ValidationInfo) -> Decimal:
+    """
+    Validate the decimal places rule of the PRICE_VALIDITY contract.
+
+    Trailing zeros count: 175.430000 has 6 places and is rejected, as in
+    ContractValidator. pydantic's decimal_places ignores them, so the rule
+    is checked here from the exponent instead.
+
+    Raises:
+        ValueError: If the value has more than 4 decimal places.
+    """
+    if exceeds_decimal_places(v):
+        raise ValueError(
+            f"PRICE_VALIDITY: {info.field_name} must have at most {MAX_DECIMAL_PLACES} "
+            f"decimal places, got {decimal_places(v)}"
+        )
+    return v
+
+
+def _validate_utc_timestamp(v: datetime) -> datetime:
+    """
+    Validate timestamp according to TIMESTAMP_VALIDITY contract.
+
+    Rules:
+        - Must be timezone-aware
+        - Must use UTC timezone
+        - Must NOT be more than 5 minutes in the future
+        - Must NOT be before year 2000
+
+    The common case (tzinfo is timezone.utc, within bounds) is a single
+    identity check and chained comparison; anything else falls through to
+    _check_timestamp_slow() to accept other UTC tzinfos or raise.
+
+    Raises:
+        ValueError: If timestamp doesn't meet validity requirements.
+    """
+    if v.tzinfo is _UTC and _MIN_VALID_TS <= v <= _max_future_cached():
+        return v
+    return _check_timestamp_slow(v)
+
+
+def _check_timestamp_slow(v: datetime) -> datetime:
+    """
+    Full TIMESTAMP_VALIDITY check with contract error messages.
+
+    Raises:
+        ValueError: If timestamp doesn't meet validity requirements.
+    """
+    if v.tzinfo is None:
+        raise ValueError(
+            "TIMESTAMP_VALIDITY: timestamp must be timezone-aware"
+        )
+
+    # Check if UTC (tzinfo.utcoffset() should be 0)
+    utc_offset = v.utcoffset()
+    if utc_offset != _ZERO_DELTA:
+        raise ValueError(
+            f"TIMESTAMP_VALIDITY: timestamp must be in UTC, got offset {utc_offset}"
+        )
+
+    # Check not too far in the future
+    if v > _max_future_cached():
+        raise ValueError(
+            f"TIMESTAMP_VALIDITY: timestamp cannot be >5min in future, got {v.isoformat()}"
+        )
+
+    # Sanity check: not before year 2000 (compare datetimes; .year only on failure)
+    if v < _MIN_VALID_TS:
+        raise ValueError(
+            f"TIMESTAMP_VALIDITY: timestamp cannot be before year {MIN_VALID_YEAR}, "
+            f"got year {v.year}"
+        )
+
+    return v
+
+
+Symbol = Annotated[
+    str,
+    StringConstraints(min_length=1, max_length=10, pattern=SYMBOL_PATTERN.pattern),
+    AfterValidator(_intern),
+]
+Price = Annotated[
+    Decimal,
+    Field(gt=0, strict=False),
+    AfterValidator(_validate_decimal_places),
+]
+UtcTimestamp = Annotated[datetime, AfterValidator(_validate_utc_timestamp)]
+NonEmptyStr = Annotated[str, StringConstraints(pattern=NON_BLANK_PATTERN)]
+CategoryStr = Annotated[NonEmptyStr, AfterValidator(_intern)]
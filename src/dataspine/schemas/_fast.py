@@ -0,0 +1,131 @@
+"""
+msgspec mirrors of the dataspine schemas for the hot ingest path.
+
+MarketDataFast and TradeDataFast carry the same fields and contracts as
+MarketData and TradeData, but decode and validate JSON batches through
+msgspec instead of pydantic. Convert to the pydantic models with
+to_pydantic() once a batch has been accepted.
+
+Requires the optional ``msgspec`` dependency (``pip install dataspine[fast]``).
+
+Example Usage:
+    >>> from dataspine.schemas._fast import decode_market_batch
+    >>>
+    >>> rows = decode_market_batch(raw_bytes)
+    >>> market_data = [row.to_pydantic() for row in rows]
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Annotated, Literal
+
+import msgspec
+
+from dataspine.schemas._common import (
+    MAX_DECIMAL_PLACES,
+    NON_BLANK_PATTERN,
+    SYMBOL_PATTERN,
+    _validate_utc_timestamp,
+    decimal_places,
+    exceeds_decimal_places,
+)
+from dataspine.schemas.market_data import MarketData
+from dataspine.schemas.trade_data import TradeData
+
+# msgspec applies patterns with re.search, where "$" also matches before a
+# trailing newline; anchor with \A...\Z so "AAPL\n" is rejected as by pydantic
+_SYMBOL_PATTERN_ANCHORED = r"\A" + SYMBOL_PATTERN.pattern.strip("^$") + r"\Z"
+
+Symbol = Annotated[
+    str, msgspec.Meta(min_length=1, max_length=10, pattern=_SYMBOL_PATTERN_ANCHORED)
+]
+NonEmptyStr = Annotated[str, msgspec.Meta(pattern=NON_BLANK_PATTERN)]
+UtcDatetime = Annotated[datetime, msgspec.Meta(tz=True)]
+
+
+def _check_price(value: Decimal, field_name: str) -> None:
+    """
+    Check PRICE_VALIDITY for a Decimal field.
+
+    msgspec cannot attach numeric constraints to Decimal, so this runs
+    from __post_init__.
+
+    Raises:
+        ValueError: If value is not a positive finite number with at most 4 decimal places.
+    """
+    if not value.is_finite() or value <= 0:
+        raise ValueError(f"PRICE_VALIDITY: {field_name} must be positive, got {value}")
+
+    # Trailing zeros count (exponent rule), as in the pydantic schema
+    if exceeds_decimal_places(value):
+        raise ValueError(
+            f"PRICE_VALIDITY: {field_name} must have at most {MAX_DECIMAL_PLACES} "
+            f"decimal places, got {decimal_places(value)}"
+        )
+
+
+class MarketDataFast(msgspec.Struct, frozen=True, gc=False):
+    """msgspec mirror of MarketData."""
+
+    symbol: Symbol
+    price: Decimal
+    timestamp: UtcDatetime
+    volume: Annotated[int, msgspec.Meta(ge=0)]
+    source: NonEmptyStr
+
+    def __post_init__(self) -> None:
+        """Run the contracts msgspec cannot express declaratively."""
+        _check_price(self.price, "price")
+        _validate_utc_timestamp(self.timestamp)
+
+    def to_pydantic(self) -> MarketData:
+        """Convert to MarketData without re-validating."""
+        return MarketData.model_construct(**msgspec.structs.asdict(self))
+
+
+class TradeDataFast(msgspec.Struct, frozen=True, gc=False):
+    """msgspec mirror of TradeData."""
+
+    trade_id: NonEmptyStr
+    client_id: NonEmptyStr
+    symbol: Symbol
+    side: Literal["BUY", "SELL"]
+    quantity: Decimal
+    price: Decimal
+    timestamp: UtcDatetime
+    venue: NonEmptyStr
+
+    def __post_init__(self) -> None:
+        """Run the contracts msgspec cannot express declaratively."""
+        _check_price(self.quantity, "quantity")
+        _check_price(self.price, "price")
+        _validate_utc_timestamp(self.timestamp)
+
+    def to_pydantic(self) -> TradeData:
+        """Convert to TradeData without re-validating."""
+        return TradeData.model_construct(**msgspec.structs.asdict(self))
+
+
+# Batch decoders, built once at import
+_MARKET_DECODER = msgspec.json.Decoder(list[MarketDataFast])
+_TRADE_DECODER = msgspec.json.Decoder(list[TradeDataFast])
+
+
+def decode_market_batch(raw: bytes | str) -> list[MarketDataFast]:
+    """
+    Decode and validate a JSON array of market data rows.
+
+    Raises:
+        msgspec.ValidationError: If any row violates the schema.
+    """
+    return _MARKET_DECODER.decode(raw)
+
+
+def decode_trade_batch(raw: bytes | str) -> list[TradeDataFast]:
+    """
+    Decode and validate a JSON array of trade data rows.
+
+    Raises:
+        msgspec.ValidationError: If any row violates the schema.
+    """
+    return _TRADE_DECODER.decode(raw)
@@ -33,18 +33,21 @@ Contracts Enforced:
     - TIMESTAMP_VALIDITY: Timezone-aware UTC, not >5min future, not before 2000
 """
 
-import re
-from datetime import datetime, timedelta, timezone
-from decimal import Decimal, InvalidOperation
-from typing import Any
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Self
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
-# Constants for validation
-SYMBOL_PATTERN = re.compile(r'^[A-Z0-9.]{1,10}$')
-MAX_DECIMAL_PLACES = 4
-MAX_FUTURE_MINUTES = 5
-MIN_VALID_YEAR = 2000
+from dataspine.schemas._common import (
+    CategoryStr,
+    Price,
+    Symbol,
+    UtcTimestamp,
+    fingerprint,
+    symbol_id,
+    to_e4,
+)
 
 
 class MarketData(BaseModel):
@@ -78,188 +81,159 @@ class MarketData(BaseModel):
     """
 
     model_config = ConfigDict(
-        validate_assignment=True,
         strict=True,
-        frozen=False,
+        frozen=True,
+        extra="forbid",
+        revalidate_instances="never",
     )
 
-    symbol: str = Field(
+    symbol: Symbol = Field(
         ...,
         description="Stock ticker symbol (uppercase, 1-10 chars, alphanumeric + period)",
         examples=["AAPL", "MSFT", "BRK.B"],
     )
-    price: Decimal = Field(
+    price: Price = Field(
         ...,
         description="Current or latest price (must be > 0, max 4 decimal places)",
         examples=[Decimal("175.4300"), Decimal("150.25")],
     )
-    timestamp: datetime = Field(
+    timestamp: UtcTimestamp = Field(
         ...,
         description="When the price was recorded (timezone-aware UTC)",
         examples=[datetime(2025, 1, 15, 14, 30, 0, tzinfo=timezone.utc)],
     )
     volume: int = Field(
         ...,
+        ge=0,
         description="Trading volume (must be >= 0)",
         examples=[2500000, 1000000],
     )
-    source: str = Field(
+    source: CategoryStr = Field(
         ...,
         description="Origin of the data",
         examples=["iex_cloud", "polygon_io"],
     )
 
-    @field_validator("symbol")
+    @property
+    def symbol_id(self) -> int:
+        """Stable int id for this symbol (see schemas._common.symbol_id)."""
+        return symbol_id(self.symbol)
+
+    @property
+    def price_e4(self) -> int:
+        """Price as a fixed-point int scaled by 10_000 (exact, no Decimal arithmetic)."""
+        return to_e4(self.price)
+
     @classmethod
-    def validate_symbol(cls, v: str) -> str:
+    def validate_many(cls, rows: list[dict[str, Any]]) -> list["MarketData"]:
         """
-        Validate symbol format according to SYMBOL_FORMAT contract.
+        Validate a batch of raw rows in a single pydantic-core call.
+
+        Reuses one compiled list validator for every row instead of
+        constructing each MarketData individually.
+
+        Args:
+            rows: List of dicts with MarketData fields.
 
-        Rules:
-            - Must be uppercase only (A-Z, 0-9, period allowed)
-            - Must be 1-10 characters long
-            - No whitespace allowed
+        Returns:
+            List of validated MarketData instances.
 
         Raises:
-            ValueError: If symbol doesn't meet format requirements.
+            ValidationError: If any row violates the schema.
         """
-        if not v:
-            raise ValueError("SYMBOL_FORMAT: symbol cannot be empty")
+        return _LIST_ADAPTER.validate_python(rows)
 
-        if v != v.upper():
-            raise ValueError(
-                f"SYMBOL_FORMAT: symbol must be uppercase only, got '{v}'"
-            )
+    @classmethod
+    def validate_many_json(cls, data: bytes | str) -> list["MarketData"]:
+        """
+        Parse and validate a JSON array of MarketData objects.
 
-        if len(v) < 1 or len(v) > 10:
-            raise ValueError(
-                f"SYMBOL_FORMAT: symbol must be 1-10 characters, got {len(v)} characters"
-            )
+        JSON parsing happens inside pydantic-core, avoiding a separate
+        json.loads() pass.
 
-        if not SYMBOL_PATTERN.match(v):
-            raise ValueError(
-                f"SYMBOL_FORMAT: symbol must contain only uppercase letters, digits, "
-                f"and periods (no whitespace), got '{v}'"
-            )
+        Args:
+            data: JSON array as bytes or str.
 
-        return v
+        Returns:
+            List of validated MarketData instances.
+
+        Raises:
+            ValidationError: If the payload is malformed or any row is invalid.
+        """
+        return _LIST_ADAPTER.validate_json(data)
 
-    @field_validator("price", mode="before")
     @classmethod
-    def validate_price(cls, v: Any) -> Decimal:
+    def dumps_batch(cls, items: list["MarketData"]) -> bytes:
         """
-        Validate price according to PRICE_VALIDITY contract.
+        Serialize a batch of MarketData instances to a JSON array.
 
-        Rules:
-            - Must be > 0
-            - Must be numeric (Decimal type)
-            - Must have <= 4 decimal places
+        Uses the shared list serializer, so the whole batch is written by
+        pydantic-core in one call. Output round-trips through
+        validate_many_json().
 
-        Raises:
-            ValueError: If price doesn't meet validity requirements.
+        Args:
+            items: MarketData instances to serialize.
+
+        Returns:
+            JSON array as UTF-8 bytes.
         """
-        # Convert to Decimal if needed
-        if not isinstance(v, Decimal):
-            try:
-                v = Decimal(str(v))
-            except (InvalidOperation, TypeError, ValueError) as e:
-                raise ValueError(
-                    f"PRICE_VALIDITY: price must be a valid decimal number, got '{v}'"
-                ) from e
-
-        if v <= 0:
-            raise ValueError(
-                f"PRICE_VALIDITY: price must be positive, got {v}"
-            )
-
-        # Check decimal places
-        sign, digits, exponent = v.as_tuple()
-        if exponent < 0 and abs(exponent) > MAX_DECIMAL_PLACES:
-            raise ValueError(
-                f"PRICE_VALIDITY: price must have at most {MAX_DECIMAL_PLACES} decimal places, "
-                f"got {abs(exponent)} decimal places in {v}"
-            )
-
-        return v
-
-    @field_validator("timestamp")
-    @classmethod
-    def validate_timestamp(cls, v: datetime) -> datetime:
+        return _LIST_ADAPTER.dump_json(items)
+
+    def to_json(self) -> bytes:
         """
-        Validate timestamp according to TIMESTAMP_VALIDITY contract.
+        Serialize this instance to JSON bytes.
 
-        Rules:
-            - Must be timezone-aware
-            - Must use UTC timezone
-            - Must NOT be more than 5 minutes in the future
-            - Must NOT be before year 2000
+        Decimals are written as strings and UTC timestamps with a "Z" suffix.
 
-        Raises:
-            ValueError: If timestamp doesn't meet validity requirements.
+        Returns:
+            JSON object as UTF-8 bytes.
         """
-        if v.tzinfo is None:
-            raise ValueError(
-                "TIMESTAMP_VALIDITY: timestamp must be timezone-aware"
-            )
-
-        # Check if UTC (tzinfo.utcoffset() should be 0)
-        utc_offset = v.utcoffset()
-        if utc_offset is None or utc_offset != timedelta(0):
-            raise ValueError(
-                f"TIMESTAMP_VALIDITY: timestamp must be in UTC, got offset {utc_offset}"
-            )
-
-        # Check not too far in the future
-        now_utc = datetime.now(timezone.utc)
-        max_future = now_utc + timedelta(minutes=MAX_FUTURE_MINUTES)
-        if v > max_future:
-            raise ValueError(
-                f"TIMESTAMP_VALIDITY: timestamp cannot be >5min in future, got {v.isoformat()}"
-            )
-
-        # Sanity check: not before year 2000
-        if v.year < MIN_VALID_YEAR:
-            raise ValueError(
-                f"TIMESTAMP_VALIDITY: timestamp cannot be before year {MIN_VALID_YEAR}, "
-                f"got year {v.year}"
-            )
-
-        return v
-
-    @field_validator("volume")
-    @classmethod
-    def validate_volume(cls, v: int) -> int:
+        return self.__pydantic_serializer__.to_json(self)
+
+    @property
+    def content_hash(self) -> int:
         """
-        Validate volume is non-negative.
+        64-bit fingerprint of to_json(), for comparing records across runs.
 
-        Rules:
-            - Must be >= 0
+        Computed on access (not cached, so model_copy() can't carry a stale
+        value). It follows the serialized form, so Decimal("1.5") and
+        Decimal("1.50") hash differently even though they compare equal.
+        """
+        return fingerprint(self.to_json())
 
-        Raises:
-            ValueError: If volume is negative.
+    @classmethod
+    def from_trusted(cls, **kwargs: Any) -> Self:
         """
-        if v < 0:
-            raise ValueError(
-                f"VOLUME_VALIDITY: volume must be >= 0, got {v}"
-            )
+        Build a MarketData from already-validated data without re-validating.
 
-        return v
+        Only for DB reads or data that passed validate_many() at the ingest
+        edge; no contracts are checked. Validate once at ingest, then use
+        this constructor downstream.
+
+        Args:
+            **kwargs: MarketData field values.
+
+        Returns:
+            MarketData instance built via model_construct().
+        """
+        return cls.model_construct(**kwargs)
 
-    @field_validator("source")
     @classmethod
-    def validate_source(cls, v: str) -> str:
+    def from_row(cls, row: tuple[Any, ...], columns: tuple[str, ...]) -> Self:
         """
-        Validate source is non-empty.
+        Build a MarketData from a DB cursor row without re-validating.
 
-        Rules:
-            - Must be non-empty string
+        Same trust boundary as from_trusted(): only for already-validated data.
 
-        Raises:
-            ValueError: If source is empty.
+        Args:
+            row: Column values in cursor order.
+            columns: Field names matching row positions.
+
+        Returns:
+            MarketData instance built via model_construct().
         """
-        if not v or not v.strip():
-            raise ValueError(
-                "REQUIRED_FIELDS: source cannot be empty"
-            )
+        return cls.model_construct(**dict(zip(columns, row, strict=True)))
+
 
-        return v
+# Shared batch validator, compiled once at import
+_LIST_ADAPTER = TypeAdapter(list[MarketData])
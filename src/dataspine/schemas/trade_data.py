@@ -37,19 +37,25 @@ Contracts Enforced:
     - TRADE_SPECIFIC: side must be "BUY" or "SELL", quantity > 0
 """
 
-import re
-from datetime import datetime, timedelta, timezone
-from decimal import Decimal, InvalidOperation
-from typing import Any, Literal
-
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Literal, Self
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from dataspine.schemas._common import (
+    CategoryStr,
+    NonEmptyStr,
+    Price,
+    Symbol,
+    UtcTimestamp,
+    fingerprint,
+    symbol_id,
+    to_e4,
+)
 
 # Constants for validation
-SYMBOL_PATTERN = re.compile(r'^[A-Z0-9.]{1,10}$')
-MAX_DECIMAL_PLACES = 4
-MAX_FUTURE_MINUTES = 5
-MIN_VALID_YEAR = 2000
-VALID_SIDES = ("BUY", "SELL")
+VALID_SIDES = frozenset(("BUY", "SELL"))
 
 
 class TradeData(BaseModel):
@@ -92,22 +98,23 @@ class TradeData(BaseModel):
     """
 
     model_config = ConfigDict(
-        validate_assignment=True,
         strict=True,
-        frozen=False,
+        frozen=True,
+        extra="forbid",
+        revalidate_instances="never",
     )
 
-    trade_id: str = Field(
+    trade_id: NonEmptyStr = Field(
         ...,
         description="Unique identifier for the trade",
         examples=["TRD-2025-0001", "TRD-2025-0002"],
     )
-    client_id: str = Field(
+    client_id: NonEmptyStr = Field(
         ...,
         description="Client who executed the trade",
         examples=["CLIENT-001", "CLIENT-002"],
     )
-    symbol: str = Field(
+    symbol: Symbol = Field(
         ...,
         description="Stock ticker symbol (uppercase, 1-10 chars, alphanumeric + period)",
         examples=["AAPL", "MSFT", "BRK.B"],
@@ -117,254 +124,152 @@ class TradeData(BaseModel):
         description="Trade direction (must be exactly 'BUY' or 'SELL')",
         examples=["BUY", "SELL"],
     )
-    quantity: Decimal = Field(
+    quantity: Price = Field(
         ...,
         description="Number of shares (must be > 0, max 4 decimal places)",
         examples=[Decimal("100.0000"), Decimal("50.5")],
     )
-    price: Decimal = Field(
+    price: Price = Field(
         ...,
         description="Execution price per share (must be > 0, max 4 decimal places)",
         examples=[Decimal("175.4300"), Decimal("150.25")],
     )
-    timestamp: datetime = Field(
+    timestamp: UtcTimestamp = Field(
         ...,
         description="When the trade was executed (timezone-aware UTC)",
         examples=[datetime(2025, 1, 15, 14, 30, 15, tzinfo=timezone.utc)],
     )
-    venue: str = Field(
+    venue: CategoryStr = Field(
         ...,
         description="Exchange or venue where trade executed",
         examples=["NYSE", "NASDAQ", "IEX"],
     )
 
-    @field_validator("trade_id")
-    @classmethod
-    def validate_trade_id(cls, v: str) -> str:
-        """
-        Validate trade_id is non-empty.
-
-        Rules:
-            - Must be non-empty string
+    @property
+    def symbol_id(self) -> int:
+        """Stable int id for this symbol (see schemas._common.symbol_id)."""
+        return symbol_id(self.symbol)
 
-        Raises:
-            ValueError: If trade_id is empty.
-        """
-        if not v or not v.strip():
-            raise ValueError(
-                "REQUIRED_FIELDS: trade_id cannot be empty"
-            )
+    @property
+    def quantity_e4(self) -> int:
+        """Quantity as a fixed-point int scaled by 10_000 (exact, no Decimal arithmetic)."""
+        return to_e4(self.quantity)
 
-        return v
+    @property
+    def price_e4(self) -> int:
+        """Price as a fixed-point int scaled by 10_000 (exact, no Decimal arithmetic)."""
+        return to_e4(self.price)
 
-    @field_validator("client_id")
     @classmethod
-    def validate_client_id(cls, v: str) -> str:
+    def validate_many(cls, rows: list[dict[str, Any]]) -> list["TradeData"]:
         """
-        Validate client_id is non-empty.
+        Validate a batch of raw rows in a single pydantic-core call.
 
-        Rules:
-            - Must be non-empty string
+        Reuses one compiled list validator for every row instead of
+        constructing each TradeData individually.
 
-        Raises:
-            ValueError: If client_id is empty.
-        """
-        if not v or not v.strip():
-            raise ValueError(
-                "REQUIRED_FIELDS: client_id cannot be empty"
-            )
+        Args:
+            rows: List of dicts with TradeData fields.
 
-        return v
+        Returns:
+            List of validated TradeData instances.
 
-    @field_validator("symbol")
-    @classmethod
-    def validate_symbol(cls, v: str) -> str:
+        Raises:
+            ValidationError: If any row violates the schema.
         """
-        Validate symbol format according to SYMBOL_FORMAT contract.
+        return _LIST_ADAPTER.validate_python(rows)
 
-        Rules:
-            - Must be uppercase only (A-Z, 0-9, period allowed)
-            - Must be 1-10 characters long
-            - No whitespace allowed
-
-        Raises:
-            ValueError: If symbol doesn't meet format requirements.
+    @classmethod
+    def validate_many_json(cls, data: bytes | str) -> list["TradeData"]:
         """
-        if not v:
-            raise ValueError("SYMBOL_FORMAT: symbol cannot be empty")
+        Parse and validate a JSON array of TradeData objects.
 
-        if v != v.upper():
-            raise ValueError(
-                f"SYMBOL_FORMAT: symbol must be uppercase only, got '{v}'"
-            )
+        JSON parsing happens inside pydantic-core, avoiding a separate
+        json.loads() pass.
 
-        if len(v) < 1 or len(v) > 10:
-            raise ValueError(
-                f"SYMBOL_FORMAT: symbol must be 1-10 characters, got {len(v)} characters"
-            )
+        Args:
+            data: JSON array as bytes or str.
 
-        if not SYMBOL_PATTERN.match(v):
-            raise ValueError(
-                f"SYMBOL_FORMAT: symbol must contain only uppercase letters, digits, "
-                f"and periods (no whitespace), got '{v}'"
-            )
+        Returns:
+            List of validated TradeData instances.
 
-        return v
+        Raises:
+            ValidationError: If the payload is malformed or any row is invalid.
+        """
+        return _LIST_ADAPTER.validate_json(data)
 
-    @field_validator("side", mode="before")
     @classmethod
-    def validate_side(cls, v: Any) -> str:
+    def dumps_batch(cls, items: list["TradeData"]) -> bytes:
         """
-        Validate side according to TRADE_SPECIFIC contract.
+        Serialize a batch of TradeData instances to a JSON array.
 
-        Rules:
-            - Must be exactly "BUY" or "SELL" (no case variations)
+        Uses the shared list serializer, so the whole batch is written by
+        pydantic-core in one call. Output round-trips through
+        validate_many_json().
 
-        Raises:
-            ValueError: If side is not exactly "BUY" or "SELL".
-        """
-        if v not in VALID_SIDES:
-            raise ValueError(
-                f"TRADE_SPECIFIC: side must be exactly 'BUY' or 'SELL', got '{v}'"
-            )
+        Args:
+            items: TradeData instances to serialize.
 
-        return v
+        Returns:
+            JSON array as UTF-8 bytes.
+        """
+        return _LIST_ADAPTER.dump_json(items)
 
-    @field_validator("quantity", mode="before")
-    @classmethod
-    def validate_quantity(cls, v: Any) -> Decimal:
+    def to_json(self) -> bytes:
         """
-        Validate quantity according to PRICE_VALIDITY contract.
+        Serialize this instance to JSON bytes.
 
-        Rules:
-            - Must be > 0
-            - Must be numeric (Decimal type)
-            - Must have <= 4 decimal places
+        Decimals are written as strings and UTC timestamps with a "Z" suffix.
 
-        Raises:
-            ValueError: If quantity doesn't meet validity requirements.
+        Returns:
+            JSON object as UTF-8 bytes.
         """
-        # Convert to Decimal if needed
-        if not isinstance(v, Decimal):
-            try:
-                v = Decimal(str(v))
-            except (InvalidOperation, TypeError, ValueError) as e:
-                raise ValueError(
-                    f"QUANTITY_VALIDITY: quantity must be a valid decimal number, got '{v}'"
-                ) from e
-
-        if v <= 0:
-            raise ValueError(
-                f"QUANTITY_VALIDITY: quantity must be positive, got {v}"
-            )
-
-        # Check decimal places
-        sign, digits, exponent = v.as_tuple()
-        if exponent < 0 and abs(exponent) > MAX_DECIMAL_PLACES:
-            raise ValueError(
-                f"QUANTITY_VALIDITY: quantity must have at most {MAX_DECIMAL_PLACES} decimal places, "
-                f"got {abs(exponent)} decimal places in {v}"
-            )
-
-        return v
-
-    @field_validator("price", mode="before")
-    @classmethod
-    def validate_price(cls, v: Any) -> Decimal:
-        """
-        Validate price according to PRICE_VALIDITY contract.
+        return self.__pydantic_serializer__.to_json(self)
 
-        Rules:
-            - Must be > 0
-            - Must be numeric (Decimal type)
-            - Must have <= 4 decimal places
+    @property
+    def content_hash(self) -> int:
+        """
+        64-bit fingerprint of to_json(), for comparing records across runs.
 
-        Raises:
-            ValueError: If price doesn't meet validity requirements.
+        Computed on access (not cached, so model_copy() can't carry a stale
+        value). It follows the serialized form, so Decimal("1.5") and
+        Decimal("1.50") hash differently even though they compare equal.
         """
-        # Convert to Decimal if needed
-        if not isinstance(v, Decimal):
-            try:
-                v = Decimal(str(v))
-            except (InvalidOperation, TypeError, ValueError) as e:
-                raise ValueError(
-                    f"PRICE_VALIDITY: price must be a valid decimal number, got '{v}'"
-                ) from e
-
-        if v <= 0:
-            raise ValueError(
-                f"PRICE_VALIDITY: price must be positive, got {v}"
-            )
-
-        # Check decimal places
-        sign, digits, exponent = v.as_tuple()
-        if exponent < 0 and abs(exponent) > MAX_DECIMAL_PLACES:
-            raise ValueError(
-                f"PRICE_VALIDITY: price must have at most {MAX_DECIMAL_PLACES} decimal places, "
-                f"got {abs(exponent)} decimal places in {v}"
-            )
-
-        return v
-
-    @field_validator("timestamp")
+        return fingerprint(self.to_json())
+
     @classmethod
-    def validate_timestamp(cls, v: datetime) -> datetime:
+    def from_trusted(cls, **kwargs: Any) -> Self:
         """
-        Validate timestamp according to TIMESTAMP_VALIDITY contract.
+        Build a TradeData from already-validated data without re-validating.
 
-        Rules:
-            - Must be timezone-aware
-            - Must use UTC timezone
-            - Must NOT be more than 5 minutes in the future
-            - Must NOT be before year 2000
+        Only for DB reads or data that passed validate_many() at the ingest
+        edge; no contracts are checked. Validate once at ingest, then use
+        this constructor downstream.
 
-        Raises:
-            ValueError: If timestamp doesn't meet validity requirements.
+        Args:
+            **kwargs: TradeData field values.
+
+        Returns:
+            TradeData instance built via model_construct().
         """
-        if v.tzinfo is None:
-            raise ValueError(
-                "TIMESTAMP_VALIDITY: timestamp must be timezone-aware"
-            )
-
-        # Check if UTC (tzinfo.utcoffset() should be 0)
-        utc_offset = v.utcoffset()
-        if utc_offset is None or utc_offset != timedelta(0):
-            raise ValueError(
-                f"TIMESTAMP_VALIDITY: timestamp must be in UTC, got offset {utc_offset}"
-            )
-
-        # Check not too far in the future
-        now_utc = datetime.now(timezone.utc)
-        max_future = now_utc + timedelta(minutes=MAX_FUTURE_MINUTES)
-        if v > max_future:
-            raise ValueError(
-                f"TIMESTAMP_VALIDITY: timestamp cannot be >5min in future, got {v.isoformat()}"
-            )
-
-        # Sanity check: not before year 2000
-        if v.year < MIN_VALID_YEAR:
-            raise ValueError(
-                f"TIMESTAMP_VALIDITY: timestamp cannot be before year {MIN_VALID_YEAR}, "
-                f"got year {v.year}"
-            )
-
-        return v
-
-    @field_validator("venue")
+        return cls.model_construct(**kwargs)
+
     @classmethod
-    def validate_venue(cls, v: str) -> str:
+    def from_row(cls, row: tuple[Any, ...], columns: tuple[str, ...]) -> Self:
         """
-        Validate venue is non-empty.
+        Build a TradeData from a DB cursor row without re-validating.
 
-        Rules:
-            - Must be non-empty string
+        Same trust boundary as from_trusted(): only for already-validated data.
 
-        Raises:
-            ValueError: If venue is empty.
+        Args:
+            row: Column values in cursor order.
+            columns: Field names matching row positions.
+
+        Returns:
+            TradeData instance built via model_construct().
         """
-        if not v or not v.strip():
-            raise ValueError(
-                "REQUIRED_FIELDS: venue cannot be empty"
-            )
+        return cls.model_construct(**dict(zip(columns, row, strict=True)))
+
 
-        return v
+# Shared batch validator, compiled once at import
+_LIST_ADAPTER = TypeAdapter(list[TradeData])
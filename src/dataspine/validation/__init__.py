@@ -3,6 +3,7 @@ Data validation for dataspine.
 
 This module exports contract validation and invariant checking functionality:
 - ContractValidator: Validates data against defined contracts
+- find_invalid_symbols: One-pass symbol format check for a batch
 - Invariant checking functions for system-wide properties
 
 Example:
@@ -13,11 +14,13 @@ Example:
     ...     check_completeness,
     ...     check_uniqueness,
     ...     check_referential_integrity,
+    ...     check_all_invariants,
     ... )
 """
 
-from dataspine.validation.contracts import ContractValidator
+from dataspine.validation.contracts import ContractValidator, find_invalid_symbols
 from dataspine.validation.invariants import (
+    check_all_invariants,
     check_completeness,
     check_idempotency,
     check_monotonic_timestamps,
@@ -27,9 +30,11 @@ from dataspine.validation.invariants import (
 
 __all__ = [
     "ContractValidator",
+    "find_invalid_symbols",
     "check_idempotency",
     "check_monotonic_timestamps",
     "check_completeness",
     "check_uniqueness",
     "check_referential_integrity",
+    "check_all_invariants",
 ]
@@ -0,0 +1,185 @@
+"""
+Columnar batch validation for dataspine.
+
+Validates whole Arrow tables against the MarketData and TradeData contracts
+with pyarrow.compute kernels, one vectorized check per column instead of
+one model instantiation per row. Intended for Arrow-native sources
+(Parquet row groups, DuckDB results, Arrow IPC from Kafka).
+
+Expected column types:
+    - symbol, source, venue, trade_id, client_id, side: string
+    - price, quantity: decimal128/decimal256
+    - timestamp: timestamp with tz="UTC"
+    - volume: integer
+
+Violations are reported with the docs/contracts.md code; non-negative
+volume and non-blank source/client_id are schema rules and report SCHEMA.
+
+Requires the optional ``pyarrow`` dependency (``pip install dataspine[arrow]``).
+
+Example Usage:
+    >>> import pyarrow.parquet as pq
+    >>> from dataspine.validation.batch import validate_market_batch
+    >>>
+    >>> table = validate_market_batch(pq.read_table("ticks.parquet"))
+"""
+
+from datetime import datetime, timezone
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from dataspine.schemas._common import (
+    _MAX_FUTURE_DELTA,
+    _MIN_VALID_TS,
+    MAX_DECIMAL_PLACES,
+    NON_BLANK_PATTERN,
+    SYMBOL_PATTERN,
+)
+
+MARKET_COLUMNS = ("symbol", "price", "timestamp", "volume", "source")
+TRADE_COLUMNS = (
+    "trade_id",
+    "client_id",
+    "symbol",
+    "side",
+    "quantity",
+    "price",
+    "timestamp",
+    "venue",
+)
+UTC_TZ_NAMES = frozenset(("UTC", "Etc/UTC", "+00:00"))
+
+_VALID_SIDES = pa.array(["BUY", "SELL"])
+
+
+def _require_columns(table: pa.Table, columns: tuple[str, ...]) -> None:
+    """Raise if any required column is missing."""
+    names = set(table.column_names)
+    for name in columns:
+        if name not in names:
+            raise ValueError(f"REQUIRED_FIELDS: Missing required field {name}")
+
+
+def _price_mask(column: pa.ChunkedArray, field_name: str) -> pa.ChunkedArray:
+    """
+    Per-row PRICE_VALIDITY mask for a decimal column.
+
+    Decimal places come from the column type: when its scale is already
+    <= 4 only positivity needs checking per row.
+
+    Raises:
+        ValueError: If the column is not a decimal type.
+    """
+    if not pa.types.is_decimal(column.type):
+        raise ValueError(
+            f"PRICE_VALIDITY: {field_name} must be Decimal type, got {column.type}"
+        )
+
+    mask = pc.greater(column, 0)
+    if column.type.scale > MAX_DECIMAL_PLACES:
+        mask = pc.and_(mask, pc.equal(pc.round(column, ndigits=MAX_DECIMAL_PLACES), column))
+    return mask
+
+
+def _timestamp_mask(column: pa.ChunkedArray, now: datetime | None) -> pa.ChunkedArray:
+    """
+    Per-row TIMESTAMP_VALIDITY mask for a timestamp column.
+
+    Timezone rules are properties of the column type, so they are checked
+    once; the per-row check is a single pair of bound comparisons.
+
+    Raises:
+        ValueError: If the column is not a UTC timestamp type.
+    """
+    if not pa.types.is_timestamp(column.type) or column.type.tz is None:
+        raise ValueError("TIMESTAMP_VALIDITY: timestamp must be timezone-aware")
+    if column.type.tz not in UTC_TZ_NAMES:
+        raise ValueError(
+            f"TIMESTAMP_VALIDITY: timestamp must be in UTC, got tz {column.type.tz}"
+        )
+
+    if now is None:
+        now = datetime.now(timezone.utc)
+    lower = pa.scalar(_MIN_VALID_TS, type=column.type)
+    upper = pa.scalar(now + _MAX_FUTURE_DELTA, type=column.type)
+    return pc.and_(pc.greater_equal(column, lower), pc.less_equal(column, upper))
+
+
+def _raise_first_violation(table: pa.Table, checks: list[tuple[str, str, pa.ChunkedArray]]) -> None:
+    """
+    Raise for the first failing row of the first failing check.
+
+    Nulls count as violations.
+
+    Raises:
+        ValueError: Message is "<CONTRACT>: invalid <field> at row <index>".
+    """
+    for code, field, mask in checks:
+        index = pc.index(pc.fill_null(mask, False), False).as_py()
+        if index >= 0:
+            value = table[field][index].as_py()
+            raise ValueError(f"{code}: invalid {field} at row {index}, got {value!r}")
+
+
+def _market_checks(table: pa.Table, now: datetime | None) -> list[tuple[str, str, pa.ChunkedArray]]:
+    """Build (contract, field, mask) triples for a market data table."""
+    _require_columns(table, MARKET_COLUMNS)
+    return [
+        ("PRICE_VALIDITY", "price", _price_mask(table["price"], "price")),
+        ("TIMESTAMP_VALIDITY", "timestamp", _timestamp_mask(table["timestamp"], now)),
+        ("SYMBOL_FORMAT", "symbol", pc.match_substring_regex(table["symbol"], SYMBOL_PATTERN.pattern)),
+        ("SCHEMA", "volume", pc.greater_equal(table["volume"], 0)),
+        ("SCHEMA", "source", pc.match_substring_regex(table["source"], NON_BLANK_PATTERN)),
+    ]
+
+
+def _trade_checks(table: pa.Table, now: datetime | None) -> list[tuple[str, str, pa.ChunkedArray]]:
+    """Build (contract, field, mask) triples for a trade data table."""
+    _require_columns(table, TRADE_COLUMNS)
+    return [
+        ("PRICE_VALIDITY", "price", _price_mask(table["price"], "price")),
+        ("PRICE_VALIDITY", "quantity", _price_mask(table["quantity"], "quantity")),
+        ("TIMESTAMP_VALIDITY", "timestamp", _timestamp_mask(table["timestamp"], now)),
+        ("SYMBOL_FORMAT", "symbol", pc.match_substring_regex(table["symbol"], SYMBOL_PATTERN.pattern)),
+        ("TRADE_SPECIFIC", "side", pc.is_in(table["side"], value_set=_VALID_SIDES)),
+        ("TRADE_SPECIFIC", "trade_id", pc.match_substring_regex(table["trade_id"], NON_BLANK_PATTERN)),
+        ("SCHEMA", "client_id", pc.match_substring_regex(table["client_id"], NON_BLANK_PATTERN)),
+        ("TRADE_SPECIFIC", "venue", pc.match_substring_regex(table["venue"], NON_BLANK_PATTERN)),
+    ]
+
+
+def validate_market_batch(table: pa.Table, now: datetime | None = None) -> pa.Table:
+    """
+    Validate an Arrow table of market data rows column-wise.
+
+    Args:
+        table: Table with the MarketData columns.
+        now: Reference time for the future-timestamp bound (default: current UTC time).
+
+    Returns:
+        The input table, unchanged, if every row passes.
+
+    Raises:
+        ValueError: On the first contract violation, with the offending row index.
+    """
+    _raise_first_violation(table, _market_checks(table, now))
+    return table
+
+
+def validate_trade_batch(table: pa.Table, now: datetime | None = None) -> pa.Table:
+    """
+    Validate an Arrow table of trade data rows column-wise.
+
+    Args:
+        table: Table with the TradeData columns.
+        now: Reference time for the future-timestamp bound (default: current UTC time).
+
+    Returns:
+        The input table, unchanged, if every row passes.
+
+    Raises:
+        ValueError: On the first contract violation, with the offending row index.
+    """
+    _raise_first_violation(table, _trade_checks(table, now))
+    return table
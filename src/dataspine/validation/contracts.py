@@ -34,21 +34,115 @@ Example Usage:
 
 import logging
 import re
+from collections.abc import Callable, Iterable, Sequence
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
-
+from operator import attrgetter
+from typing import Any
+
+from dataspine.schemas._common import (
+    _MIN_VALID_TS,
+    MAX_DECIMAL_PLACES,
+    MAX_FUTURE_MINUTES,
+    MIN_VALID_YEAR,
+    SYMBOL_PATTERN,  # noqa: F401 - kept importable from this module
+    decimal_places,
+    exceeds_decimal_places,
+    is_valid_symbol,
+)
 from dataspine.schemas.market_data import MarketData
 from dataspine.schemas.trade_data import TradeData
 
 logger = logging.getLogger(__name__)
 
-# Constants for validation
-SYMBOL_PATTERN = re.compile(r"^[A-Z0-9.]{1,10}$")
-MAX_DECIMAL_PLACES = 4
-MAX_FUTURE_MINUTES = 5
-MIN_VALID_YEAR = 2000
+# Constants for validation (pattern and bounds above are shared with the schemas)
 VALID_SIDES = ("BUY", "SELL")
 
+MARKET_REQUIRED_FIELDS = ("symbol", "price", "timestamp", "volume", "source")
+TRADE_REQUIRED_FIELDS = (
+    "trade_id",
+    "client_id",
+    "symbol",
+    "side",
+    "quantity",
+    "price",
+    "timestamp",
+    "venue",
+)
+
+# SYMBOL_PATTERN repeated over newline-terminated lines, for one-pass batch checks
+_SYMBOL_LINES = re.compile(r"(?:[A-Z0-9.]{1,10}\n)*")
+
+_ZERO_TD = timedelta(0)
+_MAX_FUTURE_TD = timedelta(minutes=MAX_FUTURE_MINUTES)
+
+# One C-level call fetches every required field as a tuple
+_get_market_required = attrgetter(*MARKET_REQUIRED_FIELDS)
+_get_trade_required = attrgetter(*TRADE_REQUIRED_FIELDS)
+
+
+def find_invalid_symbols(symbols: Sequence[str]) -> list[int]:
+    """
+    Return the indices of symbols that violate Contract 4: Symbol Format.
+
+    The common all-valid case is one regex fullmatch over the
+    newline-joined batch; the delimiter count guards against a symbol
+    that itself contains a newline. Only if that fails is each symbol
+    checked individually.
+
+    Args:
+        symbols: Symbols to check.
+
+    Returns:
+        Indices of invalid symbols, in order (empty if all are valid).
+    """
+    if not symbols:
+        return []
+
+    try:
+        joined = "\n".join(symbols) + "\n"
+    except TypeError:
+        joined = None  # Non-str entry; locate it per symbol below
+
+    if (
+        joined is not None
+        and joined.count("\n") == len(symbols)
+        and _SYMBOL_LINES.fullmatch(joined) is not None
+    ):
+        return []
+
+    return [
+        i for i, symbol in enumerate(symbols)
+        if not (isinstance(symbol, str) and is_valid_symbol(symbol))
+    ]
+
+
+def _required_field_errors(
+    data: Any, fields: tuple[str, ...], get_fields: Callable[[Any], tuple[Any, ...]]
+) -> list[str]:
+    """
+    Check Contract 1: Required Fields against a precomputed field getter.
+
+    Args:
+        data: Record to check.
+        fields: Required field names, in the order get_fields returns them.
+        get_fields: attrgetter over fields.
+
+    Returns:
+        List of error messages for missing fields.
+    """
+    try:
+        if None not in get_fields(data):
+            return []
+    except AttributeError:
+        pass  # Unset field (e.g. model_construct); report per field below
+
+    return [
+        f"REQUIRED_FIELDS: Missing required field {field}"
+        for field in fields
+        if getattr(data, field, None) is None
+    ]
+
 
 class ContractValidator:
     """
@@ -58,6 +152,10 @@ class ContractValidator:
     against the data contracts defined in the system. Each contract check is
     performed independently, and all violations are collected and returned.
 
+    The validator holds no state, so one instance can be shared across
+    threads; validate_batch() passes its per-batch clock bound and symbol
+    pre-check down as arguments.
+
     Attributes:
         None
 
@@ -69,6 +167,40 @@ class ContractValidator:
         ...         print(f"Contract violation: {error}")
     """
 
+    __slots__ = ()
+
+    def validate_batch(
+        self, records: Iterable[MarketData | TradeData]
+    ) -> list[tuple[bool, list[str]]]:
+        """
+        Validate a batch of MarketData/TradeData records.
+
+        The clock is read once for the whole batch, so every record's
+        future-timestamp check uses the same "now + 5min" bound. Symbols
+        are checked in one pass (find_invalid_symbols); the per-record
+        symbol check only runs if that pass finds a bad one.
+
+        Args:
+            records: MarketData and/or TradeData instances to validate.
+
+        Returns:
+            One (is_valid, errors) tuple per record, in input order.
+
+        Example:
+            >>> validator = ContractValidator()
+            >>> results = validator.validate_batch(records)
+            >>> rejected = [r for r, (ok, _) in zip(records, results) if not ok]
+        """
+        records = list(records)
+        max_future = datetime.now(UTC) + _MAX_FUTURE_TD
+        symbols_prechecked = not find_invalid_symbols([r.symbol for r in records])
+        return [
+            self._validate_trade(record, max_future, symbols_prechecked)
+            if isinstance(record, TradeData)
+            else self._validate_market(record, max_future, symbols_prechecked)
+            for record in records
+        ]
+
     def validate_market_data(self, data: MarketData) -> tuple[bool, list[str]]:
         """
         Validate MarketData against all applicable contracts.
@@ -93,6 +225,22 @@ class ContractValidator:
             >>> if not is_valid:
             ...     print(f"Validation failed: {errors}")
         """
+        return self._validate_market(data, None, False)
+
+    def _validate_market(
+        self, data: MarketData, max_future: datetime | None, symbols_prechecked: bool
+    ) -> tuple[bool, list[str]]:
+        """
+        validate_market_data() with per-batch arguments.
+
+        Args:
+            data: MarketData instance to validate.
+            max_future: Future-timestamp bound fixed for a batch; None reads the clock.
+            symbols_prechecked: True if the caller already checked every symbol.
+
+        Returns:
+            Tuple of (is_valid, errors), as validate_market_data().
+        """
         errors: list[str] = []
 
         # Contract 1: Required Fields
@@ -102,14 +250,15 @@ class ContractValidator:
         errors.extend(self._check_price_validity(data.price, "price"))
 
         # Contract 3: Timestamp Validity
-        errors.extend(self._check_timestamp_validity(data.timestamp))
+        errors.extend(self._check_timestamp_validity(data.timestamp, max_future))
 
         # Contract 4: Symbol Format
-        errors.extend(self._check_symbol_format(data.symbol))
+        if not symbols_prechecked:
+            errors.extend(self._check_symbol_format(data.symbol))
 
         is_valid = len(errors) == 0
 
-        if not is_valid:
+        if not is_valid and logger.isEnabledFor(logging.WARNING):
             logger.warning(
                 "Market data validation failed",
                 extra={
@@ -149,6 +298,12 @@ class ContractValidator:
             >>> if not is_valid:
             ...     print(f"Validation failed: {errors}")
         """
+        return self._validate_trade(data, None, False)
+
+    def _validate_trade(
+        self, data: TradeData, max_future: datetime | None, symbols_prechecked: bool
+    ) -> tuple[bool, list[str]]:
+        """validate_trade_data() with per-batch arguments (see _validate_market())."""
         errors: list[str] = []
 
         # Contract 1: Required Fields
@@ -159,17 +314,18 @@ class ContractValidator:
         errors.extend(self._check_price_validity(data.quantity, "quantity"))
 
         # Contract 3: Timestamp Validity
-        errors.extend(self._check_timestamp_validity(data.timestamp))
+        errors.extend(self._check_timestamp_validity(data.timestamp, max_future))
 
         # Contract 4: Symbol Format
-        errors.extend(self._check_symbol_format(data.symbol))
+        if not symbols_prechecked:
+            errors.extend(self._check_symbol_format(data.symbol))
 
         # Contract 5: Trade-Specific Rules
         errors.extend(self._check_trade_specific_rules(data))
 
         is_valid = len(errors) == 0
 
-        if not is_valid:
+        if not is_valid and logger.isEnabledFor(logging.WARNING):
             logger.warning(
                 "Trade data validation failed",
                 extra={
@@ -198,15 +354,7 @@ class ContractValidator:
         Returns:
             List of error messages for missing fields.
         """
-        errors: list[str] = []
-        required_fields = ["symbol", "price", "timestamp", "volume", "source"]
-
-        for field in required_fields:
-            value = getattr(data, field, None)
-            if value is None:
-                errors.append(f"REQUIRED_FIELDS: Missing required field {field}")
-
-        return errors
+        return _required_field_errors(data, MARKET_REQUIRED_FIELDS, _get_market_required)
 
     def _check_required_fields_trade(self, data: TradeData) -> list[str]:
         """
@@ -221,24 +369,7 @@ class ContractValidator:
         Returns:
             List of error messages for missing fields.
         """
-        errors: list[str] = []
-        required_fields = [
-            "trade_id",
-            "client_id",
-            "symbol",
-            "side",
-            "quantity",
-            "price",
-            "timestamp",
-            "venue",
-        ]
-
-        for field in required_fields:
-            value = getattr(data, field, None)
-            if value is None:
-                errors.append(f"REQUIRED_FIELDS: Missing required field {field}")
-
-        return errors
+        return _required_field_errors(data, TRADE_REQUIRED_FIELDS, _get_trade_required)
 
     def _check_price_validity(self, value: Decimal, field_name: str) -> list[str]:
         """
@@ -247,7 +378,8 @@ class ContractValidator:
         Rules:
             - Must be > 0
             - Must be Decimal type
-            - Must have <= 4 decimal places
+            - Must be finite (not NaN or Infinity)
+            - Must have <= 4 decimal places (exponent >= -4; trailing zeros count)
 
         Args:
             value: The price or quantity value to check.
@@ -266,25 +398,31 @@ class ContractValidator:
             )
             return errors  # Can't check further if not Decimal
 
+        # NaN/Infinity can't be compared or counted in decimal places
+        if not value.is_finite():
+            errors.append(
+                f"PRICE_VALIDITY: {field_name} must be a finite number, got {value}"
+            )
+            return errors
+
         # Check positive
         if value <= 0:
             errors.append(
                 f"PRICE_VALIDITY: {field_name} must be positive, got {value}"
             )
 
-        # Check decimal places
-        sign, digits, exponent = value.as_tuple()
-        if isinstance(exponent, int) and exponent < 0:
-            decimal_places = abs(exponent)
-            if decimal_places > MAX_DECIMAL_PLACES:
-                errors.append(
-                    f"PRICE_VALIDITY: {field_name} must have at most "
-                    f"{MAX_DECIMAL_PLACES} decimal places, got {decimal_places}"
-                )
+        # Check decimal places from the exponent alone (O(1) for any value)
+        if exceeds_decimal_places(value):
+            errors.append(
+                f"PRICE_VALIDITY: {field_name} must have at most "
+                f"{MAX_DECIMAL_PLACES} decimal places, got {decimal_places(value)}"
+            )
 
         return errors
 
-    def _check_timestamp_validity(self, ts: datetime) -> list[str]:
+    def _check_timestamp_validity(
+        self, ts: datetime, max_future: datetime | None = None
+    ) -> list[str]:
         """
         Check Contract 3: Timestamp Validity.
 
@@ -296,6 +434,8 @@ class ContractValidator:
 
         Args:
             ts: The timestamp to check.
+            max_future: Latest acceptable timestamp, fixed per batch by
+                validate_batch(); None reads the clock.
 
         Returns:
             List of error messages for timestamp validity violations.
@@ -303,28 +443,30 @@ class ContractValidator:
         errors: list[str] = []
 
         # Check timezone-aware
-        if ts.tzinfo is None:
+        tz = ts.tzinfo
+        if tz is None:
             errors.append("TIMESTAMP_VALIDITY: timestamp must be timezone-aware")
             return errors  # Can't check UTC if not timezone-aware
 
-        # Check UTC
-        utc_offset = ts.utcoffset()
-        if utc_offset is None or utc_offset != timedelta(0):
-            errors.append(
-                f"TIMESTAMP_VALIDITY: timestamp must be in UTC, got offset {utc_offset}"
-            )
+        # Check UTC (datetime.UTC itself needs no utcoffset() call)
+        if tz is not UTC:
+            utc_offset = ts.utcoffset()
+            if utc_offset is None or utc_offset != _ZERO_TD:
+                errors.append(
+                    f"TIMESTAMP_VALIDITY: timestamp must be in UTC, got offset {utc_offset}"
+                )
 
-        # Check not too far in future
-        now_utc = datetime.now(UTC)
-        max_future = now_utc + timedelta(minutes=MAX_FUTURE_MINUTES)
+        # Check not too far in future (bound is fixed per batch in validate_batch)
+        if max_future is None:
+            max_future = datetime.now(UTC) + _MAX_FUTURE_TD
         if ts > max_future:
             errors.append(
                 f"TIMESTAMP_VALIDITY: timestamp cannot be >5min in future, "
                 f"got {ts.isoformat()}"
             )
 
-        # Check not before year 2000
-        if ts.year < MIN_VALID_YEAR:
+        # Check not before year 2000 (datetime compare; .year only read for the message)
+        if ts < _MIN_VALID_TS:
             errors.append(
                 f"TIMESTAMP_VALIDITY: timestamp cannot be before year "
                 f"{MIN_VALID_YEAR}, got year {ts.year}"
@@ -348,6 +490,10 @@ class ContractValidator:
         Returns:
             List of error messages for symbol format violations.
         """
+        # Fast path: the pattern covers every rule, so a match needs no diagnosis
+        if symbol and is_valid_symbol(symbol):
+            return []
+
         errors: list[str] = []
 
         # Check not empty
@@ -368,12 +514,11 @@ class ContractValidator:
                 f"SYMBOL_FORMAT: symbol must be uppercase only, got '{symbol}'"
             )
 
-        # Check pattern (alphanumeric + period, no whitespace)
-        if not SYMBOL_PATTERN.match(symbol):
-            errors.append(
-                f"SYMBOL_FORMAT: symbol must contain only uppercase letters, "
-                f"digits, and periods (no whitespace), got '{symbol}'"
-            )
+        # Pattern (alphanumeric + period, no whitespace) failed on the fast path
+        errors.append(
+            f"SYMBOL_FORMAT: symbol must contain only uppercase letters, "
+            f"digits, and periods (no whitespace), got '{symbol}'"
+        )
 
         return errors
 
@@ -395,7 +540,8 @@ class ContractValidator:
         """
         errors: list[str] = []
 
-        # Check side
+        # Check side (validated sides are the Literal's own "BUY"/"SELL"
+        # objects, so the tuple membership test hits its identity shortcut)
         if data.side not in VALID_SIDES:
             errors.append(
                 f"TRADE_SPECIFIC: side must be exactly 'BUY' or 'SELL', "
@@ -408,12 +554,12 @@ class ContractValidator:
                 f"TRADE_SPECIFIC: quantity must be positive, got {data.quantity}"
             )
 
-        # Check trade_id non-empty
-        if not data.trade_id or not data.trade_id.strip():
+        # Check trade_id non-empty (isspace() avoids strip()'s copy)
+        if not data.trade_id or data.trade_id.isspace():
             errors.append("TRADE_SPECIFIC: trade_id cannot be empty")
 
         # Check venue non-empty
-        if not data.venue or not data.venue.strip():
+        if not data.venue or data.venue.isspace():
             errors.append("TRADE_SPECIFIC: venue cannot be empty")
 
         return errors
@@ -0,0 +1,94 @@
+"""
+Columnar contract validation for dataspine.
+
+Batch counterpart of ContractValidator: runs the same contracts over whole
+Arrow tables and reports every violation rather than stopping at the first
+one (see validation.batch for the fail-fast variant). The per-row
+ContractValidator API is unchanged and remains the path for single records.
+
+Requires the optional ``pyarrow`` dependency (``pip install dataspine[arrow]``).
+
+Example Usage:
+    >>> from dataspine.validation.contracts_batch import validate_market_data_batch
+    >>>
+    >>> valid, violations = validate_market_data_batch(table)
+    >>> accepted = table.filter(valid)
+    >>> for row, code in violations:
+    ...     print(f"Row {row} violates {code}")
+"""
+
+from datetime import datetime
+from functools import reduce
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from dataspine.validation.batch import _market_checks, _trade_checks
+
+
+def _collect(
+    checks: list[tuple[str, str, pa.ChunkedArray]],
+) -> tuple[pa.Array, list[tuple[int, str]]]:
+    """
+    Combine per-check masks into a row mask and a sorted violation list.
+
+    Nulls count as violations.
+
+    Returns:
+        Tuple of (valid, violations):
+            - valid: Boolean array, True for rows that pass every check
+            - violations: (row, contract code) pairs, ordered by row
+    """
+    masks = [pc.fill_null(mask, False).combine_chunks() for _, _, mask in checks]
+    valid = reduce(pc.and_, masks)
+
+    violations: list[tuple[int, str]] = []
+    if pc.all(valid).as_py():
+        return valid, violations
+
+    for (code, _, _), mask in zip(checks, masks, strict=True):
+        violations.extend((row, code) for row in pc.indices_nonzero(pc.invert(mask)).to_pylist())
+    violations.sort()
+    return valid, violations
+
+
+def validate_market_data_batch(
+    table: pa.Table, now: datetime | None = None
+) -> tuple[pa.Array, list[tuple[int, str]]]:
+    """
+    Validate an Arrow table of market data against all applicable contracts.
+
+    Args:
+        table: Table with the MarketData columns.
+        now: Reference time for the future-timestamp bound (default: current UTC time).
+
+    Returns:
+        Tuple of (valid, violations):
+            - valid: Boolean array, True for rows that pass every contract
+            - violations: (row, contract code) pairs, ordered by row
+
+    Raises:
+        ValueError: If a required column is missing or has the wrong type.
+    """
+    return _collect(_market_checks(table, now))
+
+
+def validate_trade_data_batch(
+    table: pa.Table, now: datetime | None = None
+) -> tuple[pa.Array, list[tuple[int, str]]]:
+    """
+    Validate an Arrow table of trade data against all applicable contracts.
+
+    Args:
+        table: Table with the TradeData columns.
+        now: Reference time for the future-timestamp bound (default: current UTC time).
+
+    Returns:
+        Tuple of (valid, violations):
+            - valid: Boolean array, True for rows that pass every contract
+            - violations: (row, contract code) pairs, ordered by row
+
+    Raises:
+        ValueError: If a required column is missing or has the wrong type.
+    """
+    return _collect(_trade_checks(table, now))
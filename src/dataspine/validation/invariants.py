@@ -12,6 +12,8 @@ Invariants Implemented:
     - Invariant 4: Uniqueness
     - Invariant 5: Referential Integrity
 
+check_all_invariants() runs invariants 2-4 over one batch.
+
 Example Usage:
     >>> from dataspine.validation.invariants import (
     ...     check_idempotency,
@@ -29,13 +31,16 @@ Example Usage:
 """
 
 import logging
-from collections import defaultdict
+from collections.abc import Sequence
+from collections.abc import Set as AbstractSet
+from itertools import compress, islice, repeat
+from operator import attrgetter, is_, le, ne
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
 
-def check_idempotency(batch1: list[Any], batch2: list[Any]) -> bool:
+def check_idempotency(batch1: Sequence[Any], batch2: Sequence[Any]) -> bool:
     """
     Check Invariant 1: Idempotency.
 
@@ -54,26 +59,32 @@ def check_idempotency(batch1: list[Any], batch2: list[Any]) -> bool:
         >>> batch2 = process(raw_data)  # First run
         >>> batch3 = process(raw_data)  # Second run
         >>> assert check_idempotency(batch2, batch3), "Processing is not idempotent!"
+        >>>
+        >>> # Across runs, store and compare 64-bit fingerprints instead of records
+        >>> hashes = [record.content_hash for record in batch2]
+        >>> assert check_idempotency(hashes, [record.content_hash for record in batch3])
     """
     # Check length first
     if len(batch1) != len(batch2):
-        logger.warning(
-            "Idempotency violation: batch sizes differ",
-            extra={
-                "extra_fields": {
-                    "batch1_size": len(batch1),
-                    "batch2_size": len(batch2),
-                    "difference": abs(len(batch1) - len(batch2)),
-                }
-            },
-        )
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "Idempotency violation: batch sizes differ",
+                extra={
+                    "extra_fields": {
+                        "batch1_size": len(batch1),
+                        "batch2_size": len(batch2),
+                        "difference": abs(len(batch1) - len(batch2)),
+                    }
+                },
+            )
         return False
 
-    # Compare element by element
-    differences: list[int] = []
-    for i, (item1, item2) in enumerate(zip(batch1, batch2, strict=False)):
-        if item1 != item2:
-            differences.append(i)
+    # Nothing would be logged: a short-circuiting yes/no answer is enough
+    if not logger.isEnabledFor(logging.WARNING):
+        return not any(map(ne, batch1, batch2))
+
+    # Compare element by element (pairwise != and index gathering run in C)
+    differences = list(compress(range(len(batch1)), map(ne, batch1, batch2)))
 
     if differences:
         logger.warning(
@@ -88,14 +99,15 @@ def check_idempotency(batch1: list[Any], batch2: list[Any]) -> bool:
         )
         return False
 
-    logger.debug(
-        "Idempotency check passed",
-        extra={
-            "extra_fields": {
-                "batch_size": len(batch1),
-            }
-        },
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Idempotency check passed",
+            extra={
+                "extra_fields": {
+                    "batch_size": len(batch1),
+                }
+            },
+        )
     return True
 
 
@@ -118,25 +130,41 @@ def check_monotonic_timestamps(batch: list[Any]) -> bool:
         >>> assert check_monotonic_timestamps(sorted_batch)
     """
     if len(batch) <= 1:
-        logger.debug(
-            "Monotonic timestamp check passed (trivial case)",
-            extra={
-                "extra_fields": {
-                    "batch_size": len(batch),
-                }
-            },
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Monotonic timestamp check passed (trivial case)",
+                extra={
+                    "extra_fields": {
+                        "batch_size": len(batch),
+                    }
+                },
+            )
+        return True
+
+    timestamps = [getattr(item, "timestamp", None) for item in batch]
+
+    # Fast path: one pairwise <= pass in C; violations are only gathered on failure
+    if None not in timestamps and all(map(le, timestamps, islice(timestamps, 1, None))):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Monotonic timestamp check passed",
+                extra={
+                    "extra_fields": {
+                        "batch_size": len(batch),
+                    }
+                },
+            )
         return True
 
+    # The fast path only fails on a real violation; details are for the log
+    if not logger.isEnabledFor(logging.WARNING):
+        return False
+
     violations: list[dict] = []
 
     for i in range(len(batch) - 1):
-        current = batch[i]
-        next_item = batch[i + 1]
-
-        # Get timestamps
-        current_ts = getattr(current, "timestamp", None)
-        next_ts = getattr(next_item, "timestamp", None)
+        current_ts = timestamps[i]
+        next_ts = timestamps[i + 1]
 
         if current_ts is None or next_ts is None:
             violations.append({
@@ -157,30 +185,32 @@ def check_monotonic_timestamps(batch: list[Any]) -> bool:
             })
 
     if violations:
-        logger.warning(
-            "Monotonic timestamp violation detected",
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "Monotonic timestamp violation detected",
+                extra={
+                    "extra_fields": {
+                        "violation_count": len(violations),
+                        "violations": violations[:10],  # Limit to first 10
+                        "batch_size": len(batch),
+                    }
+                },
+            )
+        return False
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Monotonic timestamp check passed",
             extra={
                 "extra_fields": {
-                    "violation_count": len(violations),
-                    "violations": violations[:10],  # Limit to first 10
                     "batch_size": len(batch),
                 }
             },
         )
-        return False
-
-    logger.debug(
-        "Monotonic timestamp check passed",
-        extra={
-            "extra_fields": {
-                "batch_size": len(batch),
-            }
-        },
-    )
     return True
 
 
-def check_completeness(batch: list[Any]) -> bool:
+def check_completeness(batch: Sequence[Any]) -> bool:
     """
     Check Invariant 3: Batch Completeness.
 
@@ -189,7 +219,7 @@ def check_completeness(batch: list[Any]) -> bool:
     - All items in batch are non-null
 
     Args:
-        batch: List of records to check.
+        batch: List (or other sequence) of records to check.
 
     Returns:
         True if batch is complete, False otherwise.
@@ -200,43 +230,45 @@ def check_completeness(batch: list[Any]) -> bool:
     """
     # Check not empty
     if not batch:
-        logger.warning(
-            "Completeness violation: batch is empty",
-            extra={
-                "extra_fields": {
-                    "batch_size": 0,
-                }
-            },
-        )
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "Completeness violation: batch is empty",
+                extra={
+                    "extra_fields": {
+                        "batch_size": 0,
+                    }
+                },
+            )
         return False
 
-    # Check all items are non-null
+    # Check all items are non-null (identity scan in C; indices only on failure)
     null_indices: list[int] = []
-    for i, item in enumerate(batch):
-        if item is None:
-            null_indices.append(i)
+    if any(map(is_, batch, repeat(None))):
+        null_indices = [i for i, item in enumerate(batch) if item is None]
 
     if null_indices:
-        logger.warning(
-            "Completeness violation: batch contains null items",
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "Completeness violation: batch contains null items",
+                extra={
+                    "extra_fields": {
+                        "null_count": len(null_indices),
+                        "null_indices": null_indices[:10],  # Limit to first 10
+                        "batch_size": len(batch),
+                    }
+                },
+            )
+        return False
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Completeness check passed",
             extra={
                 "extra_fields": {
-                    "null_count": len(null_indices),
-                    "null_indices": null_indices[:10],  # Limit to first 10
                     "batch_size": len(batch),
                 }
             },
         )
-        return False
-
-    logger.debug(
-        "Completeness check passed",
-        extra={
-            "extra_fields": {
-                "batch_size": len(batch),
-            }
-        },
-    )
     return True
 
 
@@ -268,19 +300,42 @@ def check_uniqueness(
         >>> assert check_uniqueness(records, key="id")
     """
     if not records:
-        logger.debug(
-            "Uniqueness check passed (empty batch)",
-            extra={
-                "extra_fields": {
-                    "key": key,
-                    "scope_key": scope_key,
-                }
-            },
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Uniqueness check passed (empty batch)",
+                extra={
+                    "extra_fields": {
+                        "key": key,
+                        "scope_key": scope_key,
+                    }
+                },
+            )
+        return True
+
+    # Fast path: gather keys in C and compare set size. Any collision (or a
+    # record missing the fields) falls through to the per-record scan below.
+    getter = attrgetter(key, scope_key) if scope_key else attrgetter(key)
+    try:
+        scoped_keys = list(map(getter, records))
+    except AttributeError:
+        scoped_keys = None
+
+    if scoped_keys is not None and len(set(scoped_keys)) == len(scoped_keys):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Uniqueness check passed",
+                extra={
+                    "extra_fields": {
+                        "key": key,
+                        "scope_key": scope_key,
+                        "total_records": len(records),
+                    }
+                },
+            )
         return True
 
-    # Track seen values: {scope: {key_value: [indices]}}
-    seen: dict[Any, dict[Any, list[int]]] = defaultdict(lambda: defaultdict(list))
+    # Track first occurrence: {(scope_value, key_value): index}
+    seen: dict[tuple[Any, Any], int] = {}
     duplicates: list[dict] = []
 
     for i, record in enumerate(records):
@@ -288,56 +343,54 @@ def check_uniqueness(
         if key_value is None:
             continue  # Skip records without the key field
 
-        # Determine scope
-        if scope_key:
-            scope_value = getattr(record, scope_key, None)
-        else:
-            scope_value = "__global__"
+        # Determine scope (None when uniqueness is global)
+        scope_value = getattr(record, scope_key, None) if scope_key else None
 
-        # Check if already seen
-        if key_value in seen[scope_value]:
+        scoped_key = (scope_value, key_value)
+        first = seen.setdefault(scoped_key, i)
+        if first != i:
             # This is a duplicate
             duplicates.append({
                 "key": key,
                 "key_value": str(key_value),
                 "scope_key": scope_key,
-                "scope_value": str(scope_value) if scope_value != "__global__" else None,
-                "indices": [*seen[scope_value][key_value], i],
+                "scope_value": str(scope_value) if scope_key else None,
+                "indices": [first, i],
             })
 
-        seen[scope_value][key_value].append(i)
-
     if duplicates:
-        logger.warning(
-            "Uniqueness violation: duplicate keys found",
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "Uniqueness violation: duplicate keys found",
+                extra={
+                    "extra_fields": {
+                        "duplicate_count": len(duplicates),
+                        "duplicates": duplicates[:10],  # Limit to first 10
+                        "key": key,
+                        "scope_key": scope_key,
+                        "total_records": len(records),
+                    }
+                },
+            )
+        return False
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Uniqueness check passed",
             extra={
                 "extra_fields": {
-                    "duplicate_count": len(duplicates),
-                    "duplicates": duplicates[:10],  # Limit to first 10
                     "key": key,
                     "scope_key": scope_key,
                     "total_records": len(records),
                 }
             },
         )
-        return False
-
-    logger.debug(
-        "Uniqueness check passed",
-        extra={
-            "extra_fields": {
-                "key": key,
-                "scope_key": scope_key,
-                "total_records": len(records),
-            }
-        },
-    )
     return True
 
 
 def check_referential_integrity(
     trades: list[Any],
-    known_symbols: set[str],
+    known_symbols: AbstractSet[str],
     strict: bool = False,
 ) -> bool:
     """
@@ -349,7 +402,8 @@ def check_referential_integrity(
 
     Args:
         trades: List of trade records with .symbol attribute.
-        known_symbols: Set of valid symbols from market data.
+        known_symbols: Set of valid symbols from market data (a frozenset
+            built once per universe is the cheapest to reuse).
         strict: If True, return False when unknown symbols found.
                 If False (default), log warning but return True.
 
@@ -366,53 +420,92 @@ def check_referential_integrity(
         >>> check_referential_integrity(trades, known_symbols, strict=True)  # Returns False
     """
     if not trades:
-        logger.debug(
-            "Referential integrity check passed (no trades)",
-            extra={
-                "extra_fields": {
-                    "known_symbols_count": len(known_symbols),
-                }
-            },
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Referential integrity check passed (no trades)",
+                extra={
+                    "extra_fields": {
+                        "known_symbols_count": len(known_symbols),
+                    }
+                },
+            )
         return True
 
-    unknown_symbols: dict[str, list[int]] = defaultdict(list)
+    # One set difference in C; trades are only revisited to log unknown symbols
+    symbols = [getattr(trade, "symbol", None) for trade in trades]
+    unknown_set = set(symbols).difference(known_symbols)
+    unknown_set.discard(None)
 
-    for i, trade in enumerate(trades):
-        symbol = getattr(trade, "symbol", None)
-        if symbol is None:
-            continue
+    if unknown_set:
+        log_level = logging.WARNING if not strict else logging.ERROR
+        if logger.isEnabledFor(log_level):
+            # One pass for first-seen order and affected count, only when logged
+            unknown_symbols: dict[str, None] = {}
+            affected_trade_count = 0
+            for symbol in symbols:
+                if symbol in unknown_set:
+                    unknown_symbols[symbol] = None
+                    affected_trade_count += 1
+
+            logger.log(
+                log_level,
+                "Referential integrity: unknown symbols found in trades",
+                extra={
+                    "extra_fields": {
+                        "unknown_symbol_count": len(unknown_set),
+                        "unknown_symbols": list(unknown_symbols)[:20],  # Limit
+                        "affected_trade_count": affected_trade_count,
+                        "total_trades": len(trades),
+                        "known_symbols_count": len(known_symbols),
+                        "strict_mode": strict,
+                    }
+                },
+            )
 
-        if symbol not in known_symbols:
-            unknown_symbols[symbol].append(i)
+        if strict:
+            return False
 
-    if unknown_symbols:
-        log_level = logging.WARNING if not strict else logging.ERROR
-        logger.log(
-            log_level,
-            "Referential integrity: unknown symbols found in trades",
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Referential integrity check passed",
             extra={
                 "extra_fields": {
-                    "unknown_symbol_count": len(unknown_symbols),
-                    "unknown_symbols": list(unknown_symbols.keys())[:20],  # Limit
-                    "affected_trade_count": sum(len(v) for v in unknown_symbols.values()),
                     "total_trades": len(trades),
                     "known_symbols_count": len(known_symbols),
-                    "strict_mode": strict,
                 }
             },
         )
+    return True
 
-        if strict:
-            return False
 
-    logger.debug(
-        "Referential integrity check passed",
-        extra={
-            "extra_fields": {
-                "total_trades": len(trades),
-                "known_symbols_count": len(known_symbols),
-            }
-        },
-    )
-    return True
+def check_all_invariants(
+    batch: list[Any],
+    *,
+    key: str = "trade_id",
+    scope_key: str | None = None,
+) -> dict[str, bool]:
+    """
+    Check Invariants 2-4 (timestamp ordering, completeness, uniqueness) on one batch.
+
+    Each check runs its own C-level pass (map/attrgetter/set) rather than
+    sharing a single Python loop: for pydantic records a fused per-record
+    loop is slower than three builtin passes over the same list.
+
+    Args:
+        batch: List of records with .timestamp and the key/scope_key attributes.
+        key: Field checked by check_uniqueness (default: "trade_id").
+        scope_key: Optional uniqueness scope field (e.g., "client_id").
+
+    Returns:
+        Mapping of invariant name to result:
+        {"monotonic_timestamps": ..., "completeness": ..., "uniqueness": ...}
+
+    Example:
+        >>> results = check_all_invariants(trades, scope_key="client_id")
+        >>> failed = [name for name, ok in results.items() if not ok]
+    """
+    return {
+        "monotonic_timestamps": check_monotonic_timestamps(batch),
+        "completeness": check_completeness(batch),
+        "uniqueness": check_uniqueness(batch, key=key, scope_key=scope_key),
+    }
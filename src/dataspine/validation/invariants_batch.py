@@ -0,0 +1,70 @@
+"""
+Columnar invariant checking for dataspine.
+
+Arrow-table counterparts of the invariants in validation.invariants, for
+batches that are already columnar (see validation.batch). Converting
+model lists to arrays costs more than the pure-Python checks save, so
+list batches should keep using validation.invariants.
+
+Requires the optional ``pyarrow`` dependency (``pip install dataspine[arrow]``).
+
+Example Usage:
+    >>> from dataspine.validation.invariants_batch import check_monotonic_timestamps_batch
+    >>>
+    >>> is_monotonic = check_monotonic_timestamps_batch(table)
+"""
+
+import logging
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+logger = logging.getLogger(__name__)
+
+
+def check_monotonic_timestamps_batch(table: pa.Table, column: str = "timestamp") -> bool:
+    """
+    Check Invariant 2: Timestamp Ordering over an Arrow table.
+
+    Same rule as check_monotonic_timestamps(): timestamp[i] <= timestamp[i+1]
+    for every adjacent pair, ties allowed. Nulls count as violations, and
+    empty or single-row tables pass.
+
+    Args:
+        table: Table with a timestamp column.
+        column: Name of the timestamp column.
+
+    Returns:
+        True if timestamps are monotonically non-decreasing, False otherwise.
+
+    Raises:
+        ValueError: If the column is missing.
+    """
+    if column not in table.column_names:
+        raise ValueError(f"REQUIRED_FIELDS: Missing required field {column}")
+
+    timestamps = table[column]
+    if len(timestamps) <= 1:
+        return True
+
+    # Compare each row with the next one in a single vectorized pass
+    ordered = pc.fill_null(
+        pc.less_equal(timestamps.slice(0, len(timestamps) - 1), timestamps.slice(1)), False
+    )
+    if pc.all(ordered).as_py():
+        return True
+
+    if logger.isEnabledFor(logging.WARNING):
+        decreased = pc.invert(ordered)
+        logger.warning(
+            "Monotonic timestamp violation detected",
+            extra={
+                "extra_fields": {
+                    "violation_count": pc.sum(decreased).as_py(),
+                    "first_violation_index": pc.index(decreased, True).as_py(),
+                    "batch_size": len(timestamps),
+                }
+            },
+        )
+
+    return False
@@ -1,8 +1,78 @@
 """Pytest configuration and fixtures."""
 
 import sys
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
 from pathlib import Path
 
+import pytest
+
 # Add src/ to Python path
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
+
+from dataspine.schemas import MarketData, TradeData  # noqa: E402
+from dataspine.validation import ContractValidator  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def validator():
+    """One ContractValidator for the session (tests run serially within a worker)."""
+    return ContractValidator()
+
+
+@pytest.fixture(scope="session")
+def now_utc():
+    """Fixed reference time for test records."""
+    return datetime(2025, 1, 15, 14, 30, 0, tzinfo=UTC)
+
+
+@pytest.fixture(scope="session")
+def sample_md(now_utc):
+    """Valid MarketData, built once; derive variants with model_copy(update=...)."""
+    return MarketData(
+        symbol="AAPL",
+        price=Decimal("175.43"),
+        timestamp=now_utc,
+        volume=1000000,
+        source="test",
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_td(now_utc):
+    """Valid TradeData, built once; derive variants with model_copy(update=...)."""
+    return TradeData(
+        trade_id="TRD-001",
+        client_id="CLIENT-001",
+        symbol="AAPL",
+        side="BUY",
+        quantity=Decimal("100"),
+        price=Decimal("175.43"),
+        timestamp=now_utc,
+        venue="NYSE",
+    )
+
+
+@pytest.fixture(scope="session")
+def trade_pool(now_utc):
+    """Three trades TRD-000..TRD-002 for one client, 10s apart (unvalidated, trusted data)."""
+    return [
+        TradeData.model_construct(
+            trade_id=f"TRD-{i:03d}",
+            client_id="CLIENT-001",
+            symbol="AAPL",
+            side="BUY",
+            quantity=Decimal("100"),
+            price=Decimal("175.43"),
+            timestamp=now_utc + timedelta(seconds=i * 10),
+            venue="NYSE",
+        )
+        for i in range(3)
+    ]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _pydantic_warmup(sample_md, sample_td):
+    """Validate one record per model up front, so per-process first-call costs hit no test."""
+    yield
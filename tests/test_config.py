@@ -0,0 +1,67 @@
+"""
+Pytest test suite for dataspine configuration loading.
+
+Tests load_config() for:
+- Typed, immutable config values
+- Process-level caching
+- Missing required variables
+"""
+
+import dataclasses
+
+import pytest
+
+from dataspine.config import Config, load_config
+
+ENV = {
+    "DATASPINE_SKIP_DOTENV": "1",
+    "DB_HOST": "localhost",
+    "DB_PORT": "5433",
+    "DB_NAME": "dataspine",
+    "DB_USER": "dataspine_user",
+    "DB_PASS": "secret",
+}
+
+# Optional variables, unset so their defaults don't depend on the caller's environment
+DEFAULTED = ("LOG_LEVEL", "APP_ENV")
+
+
+@pytest.fixture
+def env(monkeypatch):
+    """Populate required environment variables, unset optional ones, and reset the config cache."""
+    for name, value in ENV.items():
+        monkeypatch.setenv(name, value)
+    for name in DEFAULTED:
+        monkeypatch.delenv(name, raising=False)
+    load_config.cache_clear()
+    yield monkeypatch
+    load_config.cache_clear()
+
+
+class TestLoadConfig:
+    """Tests for load_config."""
+
+    def test_load_config_values(self, env):
+        """Config should expose typed values from the environment."""
+        config = load_config()
+
+        assert isinstance(config, Config)
+        assert config.db_host == "localhost"
+        assert config.db_port == 5433, "DB_PORT should be parsed as int"
+        assert config.log_level == "INFO", "LOG_LEVEL should default to INFO"
+        assert config.app_env == "development", "APP_ENV should default to development"
+
+    def test_load_config_cached_and_frozen(self, env):
+        """Repeated calls should return the same immutable instance."""
+        config = load_config()
+
+        assert load_config() is config, "load_config() should be cached"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.db_host = "other"
+
+    def test_load_config_missing_required(self, env):
+        """Missing required variables should exit."""
+        env.delenv("DB_PASS")
+
+        with pytest.raises(SystemExit):
+            load_config()
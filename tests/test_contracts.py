@@ -7,14 +7,18 @@ Tests ContractValidator class and invariant checking functions for:
 - Invariant enforcement
 """
 
-from datetime import UTC, datetime, timedelta
+import logging
+from datetime import UTC, datetime, timedelta, timezone
 from decimal import Decimal
+from zoneinfo import ZoneInfo
 
 import pytest
+from pydantic import TypeAdapter
 
 from dataspine.schemas import MarketData, TradeData
-from dataspine.validation.contracts import ContractValidator
+from dataspine.validation.contracts import find_invalid_symbols
 from dataspine.validation.invariants import (
+    check_all_invariants,
     check_completeness,
     check_idempotency,
     check_monotonic_timestamps,
@@ -22,159 +26,261 @@ from dataspine.validation.invariants import (
     check_uniqueness,
 )
 
+# Fixed reference time (same instant as the now_utc fixture)
+NOW = datetime(2025, 1, 15, 14, 30, 0, tzinfo=UTC)
+
+# Recurring prices/quantities, parsed once at import
+_P_175_43 = Decimal("175.43")
+_P_175_4300 = Decimal("175.4300")
+_P_175_50 = Decimal("175.50")
+_P_175_55 = Decimal("175.55")
+_P_176_00 = Decimal("176.00")
+_P_400_00 = Decimal("400.00")
+_P_NEGATIVE = Decimal("-10.50")
+_P_5_PLACES = Decimal("1.00001")
+_Q_100 = Decimal("100")
+
+# validate_* result for a record that passes every contract
+EXPECTED_OK = (True, [])
+
+KNOWN_SYMBOLS = frozenset(("AAPL", "MSFT", "GOOGL"))
+
+MD_ADAPTER = TypeAdapter(MarketData)
+TD_ADAPTER = TypeAdapter(TradeData)
+
+BASE_MD_KWARGS = {
+    "symbol": "AAPL",
+    "price": _P_175_43,
+    "timestamp": NOW,
+    "volume": 2500000,
+    "source": "iex_cloud",
+}
+
+
+def _has_tag(errors, tag):
+    """True if any error message contains the contract tag."""
+    return any(tag in err for err in errors)
+
+
+def _md(**overrides):
+    """MarketData from BASE_MD_KWARGS, unvalidated (model_construct); for trusted test data."""
+    return MarketData.model_construct(**{**BASE_MD_KWARGS, **overrides})
+
+
+# Shared records for table-driven invariant tests (models are frozen)
+MD_AAPL = _md()
+MD_AAPL_176 = _md(price=_P_176_00)
+MD_MSFT = _md(symbol="MSFT", price=_P_400_00, timestamp=NOW + timedelta(minutes=1), volume=500000)
+BATCH_ONE = (MD_AAPL,)
+BATCH_DUP = (MD_AAPL, MD_AAPL)
+BATCH_TWO = (MD_AAPL, MD_MSFT)
+
 
 class TestContractValidatorMarketData:
     """Tests for ContractValidator with MarketData."""
 
     @pytest.mark.smoke
-    def test_contract_validator_market_valid(self):
+    def test_contract_validator_market_valid(self, validator):
         """Valid MarketData should pass all contracts."""
-        validator = ContractValidator()
-
-        md = MarketData(
-            symbol="AAPL",
-            price=Decimal("175.4300"),
-            timestamp=datetime.now(UTC),
-            volume=2500000,
-            source="iex_cloud",
-        )
+        md = MD_ADAPTER.validate_python(
+            {
+                "symbol": "AAPL",
+                "price": _P_175_4300,
+                "timestamp": NOW,
+                "volume": 2500000,
+                "source": "iex_cloud",
+            }
+        )
+
+        assert validator.validate_market_data(md) == EXPECTED_OK
+
+    @pytest.mark.parametrize(
+        "overrides, tag, min_errors",
+        [
+            pytest.param({"price": _P_NEGATIVE}, "PRICE_VALIDITY", 1, id="negative_price"),
+            pytest.param({"symbol": "aapl"}, "SYMBOL_FORMAT", 1, id="lowercase_symbol"),
+            pytest.param(
+                {"timestamp": datetime(2025, 1, 15, 14, 30, 0)},
+                "TIMESTAMP_VALIDITY",
+                1,
+                id="naive_timestamp",
+            ),
+            pytest.param(
+                {
+                    "symbol": "aapl",
+                    "price": _P_NEGATIVE,
+                    "timestamp": datetime(2025, 1, 15, 14, 30, 0),
+                    "volume": -100,  # Not a ContractValidator rule
+                },
+                None,
+                2,
+                id="multiple_errors",
+            ),
+        ],
+    )
+    def test_contract_validator_market_invalid(self, validator, overrides, tag, min_errors):
+        """MarketData violating a contract should fail with that contract's tag."""
+        # Use model_construct to bypass Pydantic validation and test ContractValidator
+        md = _md(**overrides)
 
         is_valid, errors = validator.validate_market_data(md)
 
-        assert is_valid is True, f"Valid MarketData should pass, got errors: {errors}"
-        assert errors == [], f"Should have no errors, got: {errors}"
-
-    def test_contract_validator_market_invalid_price(self):
-        """MarketData with invalid price should fail validation."""
-        validator = ContractValidator()
+        assert is_valid is False, f"{overrides} should fail validation"
+        assert len(errors) >= min_errors, f"Expected >= {min_errors} errors, got: {errors}"
+        if tag is not None:
+            assert _has_tag(errors, tag), f"Should have {tag} error, got: {errors}"
 
-        # Use model_construct to bypass Pydantic validation and test ContractValidator
-        md = MarketData.model_construct(
-            symbol="AAPL",
-            price=Decimal("-10.50"),  # Negative price
-            timestamp=datetime.now(UTC),
-            volume=2500000,
-            source="iex_cloud",
-        )
+    @pytest.mark.parametrize("price", [Decimal("NaN"), Decimal("Infinity"), _P_5_PLACES])
+    def test_contract_validator_market_invalid_price_value(self, validator, price):
+        """Non-finite prices and prices with >4 decimal places should fail validation."""
+        md = _md(price=price)
 
         is_valid, errors = validator.validate_market_data(md)
 
-        assert is_valid is False, "Negative price should fail validation"
-        assert len(errors) >= 1, "Should have at least one error"
-        assert any("PRICE_VALIDITY" in err for err in errors), (
+        assert is_valid is False, f"Price {price} should fail validation"
+        assert _has_tag(errors, "PRICE_VALIDITY"), (
             f"Should have PRICE_VALIDITY error, got: {errors}"
         )
 
-    def test_contract_validator_market_invalid_symbol(self):
-        """MarketData with invalid symbol should fail validation."""
-        validator = ContractValidator()
+    def test_contract_validator_market_price_trailing_zeros(self, validator):
+        """Trailing zeros count as decimal places: 175.430000 has 6 and should fail."""
+        _, errors = validator.validate_market_data(_md(price=Decimal("175.430000")))
+
+        assert errors == ["PRICE_VALIDITY: price must have at most 4 decimal places, got 6"]
+
+    @pytest.mark.parametrize(
+        "price, places",
+        [
+            ("12345678901234567890123456.12345", 5),
+            ("1.000000000000000000000000000001", 30),
+            ("1E-10000000", 10_000_000),
+        ],
+    )
+    def test_contract_validator_market_price_places_exact(self, validator, price, places):
+        """Decimal places should come from the exponent, beyond 28 digits and for huge exponents."""
+        _, errors = validator.validate_market_data(_md(price=Decimal(price)))
+
+        assert errors == [
+            f"PRICE_VALIDITY: price must have at most 4 decimal places, got {places}"
+        ]
+
+    def test_contract_validator_market_price_huge_exponent(self, validator):
+        """A huge positive exponent is a whole number and should pass without expansion."""
+        md = _md(price=Decimal("1E+10000000"))
+
+        assert validator.validate_market_data(md) == EXPECTED_OK
+
+    def test_contract_validator_symbol_errors_diagnosed(self, validator):
+        """Invalid symbols should still get each specific diagnostic."""
+        errors = validator._check_symbol_format("toolongsymbol")
 
+        assert len(errors) == 3, f"Expected length, uppercase and pattern errors, got: {errors}"
+        assert "1-10 characters" in errors[0]
+        assert "uppercase only" in errors[1]
+        assert validator._check_symbol_format("") == ["SYMBOL_FORMAT: symbol cannot be empty"]
+
+    def test_contract_validator_market_invalid_symbol_trailing_newline(self, validator):
+        """Symbol with a trailing newline should fail validation."""
         # Use model_construct to bypass Pydantic validation
-        md = MarketData.model_construct(
-            symbol="aapl",  # lowercase
-            price=Decimal("175.43"),
-            timestamp=datetime.now(UTC),
-            volume=2500000,
-            source="iex_cloud",
-        )
+        md = _md(symbol="AAPL\n")
 
         is_valid, errors = validator.validate_market_data(md)
 
-        assert is_valid is False, "Lowercase symbol should fail validation"
-        assert any("SYMBOL_FORMAT" in err for err in errors), (
+        assert is_valid is False, "Symbol with newline should fail validation"
+        assert _has_tag(errors, "SYMBOL_FORMAT"), (
             f"Should have SYMBOL_FORMAT error, got: {errors}"
         )
 
-    def test_contract_validator_market_invalid_timestamp_naive(self):
-        """MarketData with naive timestamp should fail validation."""
-        validator = ContractValidator()
-
+    def test_contract_validator_market_missing_required_field(self, validator):
+        """MarketData with a null required field should fail REQUIRED_FIELDS."""
         # Use model_construct to bypass Pydantic validation
-        md = MarketData.model_construct(
-            symbol="AAPL",
-            price=Decimal("175.43"),
-            timestamp=datetime(2025, 1, 15, 14, 30, 0),  # Naive - no timezone
-            volume=2500000,
-            source="iex_cloud",
+        md = _md(
+            volume=None,  # Null required field
         )
 
         is_valid, errors = validator.validate_market_data(md)
 
-        assert is_valid is False, "Naive timestamp should fail validation"
-        assert any("TIMESTAMP_VALIDITY" in err for err in errors), (
-            f"Should have TIMESTAMP_VALIDITY error, got: {errors}"
+        assert is_valid is False, "Null volume should fail validation"
+        assert errors == ["REQUIRED_FIELDS: Missing required field volume"], (
+            f"Should report only the missing field, got: {errors}"
         )
 
-    def test_contract_validator_market_multiple_errors(self):
-        """MarketData with multiple violations should report all errors."""
-        validator = ContractValidator()
-
-        # Use model_construct to create data with multiple violations
-        md = MarketData.model_construct(
-            symbol="aapl",  # lowercase
-            price=Decimal("-10.50"),  # negative
-            timestamp=datetime(2025, 1, 15, 14, 30, 0),  # naive
-            volume=-100,  # negative (not caught by ContractValidator, but good to test)
-            source="iex_cloud",
-        )
+    @pytest.mark.parametrize(
+        "tz, expected_valid",
+        [
+            (UTC, True),
+            (ZoneInfo("UTC"), True),
+            (timezone(timedelta(hours=5)), False),
+        ],
+    )
+    def test_contract_validator_market_timestamp_timezone(self, validator, tz, expected_valid):
+        """Only timestamps with a zero UTC offset should pass."""
+        md = _md(timestamp=datetime(2025, 1, 15, 14, 30, 0, tzinfo=tz))
 
         is_valid, errors = validator.validate_market_data(md)
 
-        assert is_valid is False, "Multiple violations should fail validation"
-        assert len(errors) >= 2, f"Should have multiple errors, got {len(errors)}: {errors}"
+        assert is_valid is expected_valid, f"tzinfo {tz!r} gave errors: {errors}"
+
+    @pytest.mark.parametrize(
+        "ts, expected_valid",
+        [
+            (datetime(2000, 1, 1, tzinfo=UTC), True),
+            (datetime(1999, 12, 31, 23, 59, 59, 999999, tzinfo=UTC), False),
+        ],
+    )
+    def test_contract_validator_market_timestamp_min_year_boundary(self, validator, ts, expected_valid):
+        """The lower bound should be exactly 2000-01-01T00:00:00Z."""
+        md = _md(timestamp=ts)
+
+        is_valid, errors = validator.validate_market_data(md)
+
+        assert is_valid is expected_valid, f"{ts.isoformat()} gave errors: {errors}"
 
 
 class TestContractValidatorTradeData:
     """Tests for ContractValidator with TradeData."""
 
     @pytest.mark.smoke
-    def test_contract_validator_trade_valid(self):
+    def test_contract_validator_trade_valid(self, validator):
         """Valid TradeData should pass all contracts."""
-        validator = ContractValidator()
-
-        td = TradeData(
-            trade_id="TRD-2025-0001",
-            client_id="CLIENT-001",
-            symbol="AAPL",
-            side="BUY",
-            quantity=Decimal("100.0000"),
-            price=Decimal("175.4300"),
-            timestamp=datetime.now(UTC),
-            venue="NASDAQ",
-        )
-
-        is_valid, errors = validator.validate_trade_data(td)
-
-        assert is_valid is True, f"Valid TradeData should pass, got errors: {errors}"
-        assert errors == [], f"Should have no errors, got: {errors}"
-
-    def test_contract_validator_trade_invalid_side(self):
+        td = TD_ADAPTER.validate_python(
+            {
+                "trade_id": "TRD-2025-0001",
+                "client_id": "CLIENT-001",
+                "symbol": "AAPL",
+                "side": "BUY",
+                "quantity": Decimal("100.0000"),
+                "price": _P_175_4300,
+                "timestamp": NOW,
+                "venue": "NASDAQ",
+            }
+        )
+
+        assert validator.validate_trade_data(td) == EXPECTED_OK
+
+    def test_contract_validator_trade_invalid_side(self, validator):
         """TradeData with invalid side should fail validation."""
-        validator = ContractValidator()
-
         # Use model_construct to bypass Pydantic validation
         td = TradeData.model_construct(
             trade_id="TRD-001",
             client_id="CLIENT-001",
             symbol="AAPL",
             side="HOLD",  # Invalid side
-            quantity=Decimal("100"),
-            price=Decimal("175.43"),
-            timestamp=datetime.now(UTC),
+            quantity=_Q_100,
+            price=_P_175_43,
+            timestamp=NOW,
             venue="NYSE",
         )
 
         is_valid, errors = validator.validate_trade_data(td)
 
         assert is_valid is False, "Invalid side should fail validation"
-        assert any("TRADE_SPECIFIC" in err for err in errors), (
+        assert _has_tag(errors, "TRADE_SPECIFIC"), (
             f"Should have TRADE_SPECIFIC error for side, got: {errors}"
         )
 
-    def test_contract_validator_trade_invalid_quantity(self):
+    def test_contract_validator_trade_invalid_quantity(self, validator):
         """TradeData with zero quantity should fail validation."""
-        validator = ContractValidator()
-
         # Use model_construct to bypass Pydantic validation
         td = TradeData.model_construct(
             trade_id="TRD-001",
@@ -182,8 +288,8 @@ class TestContractValidatorTradeData:
             symbol="AAPL",
             side="BUY",
             quantity=Decimal("0"),  # Zero quantity
-            price=Decimal("175.43"),
-            timestamp=datetime.now(UTC),
+            price=_P_175_43,
+            timestamp=NOW,
             venue="NYSE",
         )
 
@@ -191,461 +297,293 @@ class TestContractValidatorTradeData:
 
         assert is_valid is False, "Zero quantity should fail validation"
         # Check for either PRICE_VALIDITY (for quantity) or TRADE_SPECIFIC
-        assert any("VALIDITY" in err or "TRADE_SPECIFIC" in err for err in errors), (
+        assert _has_tag(errors, "VALIDITY") or _has_tag(errors, "TRADE_SPECIFIC"), (
             f"Should have validity error for quantity, got: {errors}"
         )
 
-    def test_contract_validator_trade_invalid_empty_venue(self):
-        """TradeData with empty venue should fail validation."""
-        validator = ContractValidator()
-
+    @pytest.mark.parametrize("venue", ["", "   ", "\t\n"])
+    def test_contract_validator_trade_invalid_empty_venue(self, validator, venue):
+        """TradeData with empty or whitespace-only venue should fail validation."""
         # Use model_construct to bypass Pydantic validation
         td = TradeData.model_construct(
             trade_id="TRD-001",
             client_id="CLIENT-001",
             symbol="AAPL",
             side="BUY",
-            quantity=Decimal("100"),
-            price=Decimal("175.43"),
-            timestamp=datetime.now(UTC),
-            venue="",  # Empty venue
+            quantity=_Q_100,
+            price=_P_175_43,
+            timestamp=NOW,
+            venue=venue,  # Empty or whitespace-only venue
         )
 
         is_valid, errors = validator.validate_trade_data(td)
 
         assert is_valid is False, "Empty venue should fail validation"
-        assert any("TRADE_SPECIFIC" in err for err in errors), (
+        assert _has_tag(errors, "TRADE_SPECIFIC"), (
             f"Should have TRADE_SPECIFIC error for venue, got: {errors}"
         )
 
 
-class TestInvariantsIdempotency:
-    """Tests for idempotency invariant checking."""
-
-    @pytest.mark.smoke
-    def test_invariants_idempotency_identical(self):
-        """Identical batches should pass idempotency check."""
-        md1 = MarketData(
-            symbol="AAPL",
-            price=Decimal("175.43"),
-            timestamp=datetime(2025, 1, 15, 14, 30, 0, tzinfo=UTC),
-            volume=1000000,
-            source="test",
-        )
-        md2 = MarketData(
-            symbol="MSFT",
-            price=Decimal("400.00"),
-            timestamp=datetime(2025, 1, 15, 14, 31, 0, tzinfo=UTC),
-            volume=500000,
-            source="test",
-        )
-
-        batch1 = [md1, md2]
-        batch2 = [md1, md2]
-
-        result = check_idempotency(batch1, batch2)
-
-        assert result is True, "Identical batches should be idempotent"
-
-    def test_invariants_idempotency_different_length(self):
-        """Batches with different lengths should fail idempotency check."""
-        md = MarketData(
-            symbol="AAPL",
-            price=Decimal("175.43"),
-            timestamp=datetime.now(UTC),
-            volume=1000000,
-            source="test",
-        )
-
-        batch1 = [md, md]
-        batch2 = [md]
-
-        result = check_idempotency(batch1, batch2)
-
-        assert result is False, "Different length batches should fail idempotency"
-
-    def test_invariants_idempotency_different_content(self):
-        """Batches with different content should fail idempotency check."""
-        md1 = MarketData(
-            symbol="AAPL",
-            price=Decimal("175.43"),
-            timestamp=datetime(2025, 1, 15, 14, 30, 0, tzinfo=UTC),
-            volume=1000000,
-            source="test",
-        )
-        md2 = MarketData(
-            symbol="AAPL",
-            price=Decimal("176.00"),  # Different price
-            timestamp=datetime(2025, 1, 15, 14, 30, 0, tzinfo=UTC),
-            volume=1000000,
-            source="test",
-        )
+class TestContractValidatorBatch:
+    """Tests for ContractValidator.validate_batch."""
+
+    def test_contract_validator_batch_mixed(self, validator):
+        """validate_batch should return one result per record, in order."""
+        now = datetime.now(UTC)  # The >5min-future bound is relative to the wall clock
+
+        records = [
+            _md(timestamp=now),
+            TradeData.model_construct(
+                trade_id="TRD-001",
+                client_id="CLIENT-001",
+                symbol="AAPL",
+                side="HOLD",  # Invalid side
+                quantity=_Q_100,
+                price=_P_175_43,
+                timestamp=now,
+                venue="NYSE",
+            ),
+            _md(
+                timestamp=now + timedelta(hours=1),  # Too far in the future
+            ),
+        ]
+
+        results = validator.validate_batch(records)
+
+        assert [is_valid for is_valid, _ in results] == [True, False, False]
+        assert _has_tag(results[1][1], "TRADE_SPECIFIC")
+        assert _has_tag(results[2][1], "TIMESTAMP_VALIDITY")
+
+    def test_contract_validator_batch_invalid_symbol(self, validator):
+        """A bad symbol in a batch should still be reported on its record."""
+        records = [
+            _md(symbol=symbol)
+            for symbol in ("AAPL", "aapl")
+        ]
+
+        results = validator.validate_batch(records)
+
+        assert results[0] == EXPECTED_OK, f"Valid symbol should pass, got {results[0]}"
+        assert _has_tag(results[1][1], "SYMBOL_FORMAT")
+
+    def test_contract_validator_batch_reentrant(self, validator):
+        """A single-record call made during a batch should still check its symbol."""
+        nested = []
+
+        class _Reenter(logging.Handler):
+            def emit(self, record):
+                # The nested call logs too; only re-enter from the batch's warning
+                if not self.entered:
+                    self.entered = True
+                    nested.append(validator.validate_market_data(_md(symbol="aapl")))
+
+        handler = _Reenter(logging.WARNING)
+        handler.entered = False
+        contract_logger = logging.getLogger("dataspine.validation.contracts")
+        contract_logger.addHandler(handler)
+        try:
+            # All symbols valid; the negative price makes the batch log a warning
+            validator.validate_batch([_md(price=_P_NEGATIVE)])
+        finally:
+            contract_logger.removeHandler(handler)
+
+        assert nested, "Batch should have logged the invalid record"
+        assert _has_tag(nested[0][1], "SYMBOL_FORMAT"), f"Nested call skipped symbols: {nested}"
+
+    @pytest.mark.parametrize(
+        "symbols, expected",
+        [
+            ([], []),
+            (["AAPL", "BRK.B", "X"], []),
+            (["AAPL", "aapl", "TOOLONGSYMBOL"], [1, 2]),
+            (["AAPL\nMSFT"], [0]),
+            (["AAPL", None], [1]),
+        ],
+    )
+    def test_find_invalid_symbols(self, symbols, expected):
+        """find_invalid_symbols should return the indices of bad symbols."""
+        assert find_invalid_symbols(symbols) == expected
 
-        batch1 = [md1]
-        batch2 = [md2]
 
-        result = check_idempotency(batch1, batch2)
+class TestInvariantsIdempotency:
+    """Tests for idempotency invariant checking."""
 
-        assert result is False, "Different content batches should fail idempotency"
+    @pytest.mark.parametrize(
+        "batch1, batch2, expected",
+        [
+            pytest.param(
+                BATCH_TWO, BATCH_TWO, True, id="identical", marks=pytest.mark.smoke
+            ),
+            pytest.param(BATCH_DUP, BATCH_ONE, False, id="different_length"),
+            pytest.param(BATCH_ONE, (MD_AAPL_176,), False, id="different_content"),
+        ],
+    )
+    def test_invariants_idempotency(self, batch1, batch2, expected):
+        """Batches are idempotent only if equal record by record."""
+        assert check_idempotency(batch1, batch2) is expected
+
+    def test_invariants_idempotency_logging_disabled(self, caplog, sample_md):
+        """Result should not depend on whether warnings are logged."""
+        caplog.set_level(logging.CRITICAL, logger="dataspine.validation.invariants")
+        md1 = sample_md
+        md2 = md1.model_copy(update={"price": _P_176_00})
+
+        assert check_idempotency([md1, md2], [md1, md2]) is True
+        assert check_idempotency([md1, md1], [md1, md2]) is False
+        assert caplog.records == [], "Nothing should be logged at CRITICAL level"
 
 
 class TestInvariantsMonotonicTimestamps:
     """Tests for monotonic timestamp invariant checking."""
 
-    @pytest.mark.smoke
-    def test_invariants_monotonic_pass(self):
-        """Batch with increasing timestamps should pass monotonic check."""
-        now = datetime.now(UTC)
-
-        md1 = MarketData(
-            symbol="AAPL",
-            price=Decimal("175.43"),
-            timestamp=now,
-            volume=1000000,
-            source="test",
-        )
-        md2 = MarketData(
-            symbol="AAPL",
-            price=Decimal("175.50"),
-            timestamp=now + timedelta(seconds=10),
-            volume=1000100,
-            source="test",
-        )
-        md3 = MarketData(
-            symbol="AAPL",
-            price=Decimal("175.55"),
-            timestamp=now + timedelta(seconds=20),
-            volume=1000200,
-            source="test",
-        )
-
-        batch = [md1, md2, md3]
+    @pytest.mark.parametrize(
+        "offsets, expected",
+        [
+            pytest.param([0, 10, 20], True, id="increasing", marks=pytest.mark.smoke),
+            pytest.param([0, 0], True, id="equal"),  # Ties allowed
+            pytest.param([0, 20, 10], False, id="decreasing"),
+            pytest.param([], True, id="empty"),
+            pytest.param([0], True, id="single"),
+            pytest.param([0, None], False, id="missing_timestamp"),
+        ],
+    )
+    def test_invariants_monotonic(self, offsets, expected):
+        """Timestamps at NOW + offset seconds; None is a record without a timestamp."""
+        batch = [
+            object() if offset is None else _md(timestamp=NOW + timedelta(seconds=offset))
+            for offset in offsets
+        ]
 
         result = check_monotonic_timestamps(batch)
 
-        assert result is True, "Increasing timestamps should pass monotonic check"
-
-    def test_invariants_monotonic_equal_timestamps(self):
-        """Batch with equal timestamps should pass monotonic check."""
-        now = datetime.now(UTC)
-
-        md1 = MarketData(
-            symbol="AAPL",
-            price=Decimal("175.43"),
-            timestamp=now,
-            volume=1000000,
-            source="test",
-        )
-        md2 = MarketData(
-            symbol="MSFT",
-            price=Decimal("400.00"),
-            timestamp=now,  # Same timestamp
-            volume=500000,
-            source="test",
-        )
-
-        batch = [md1, md2]
-
-        result = check_monotonic_timestamps(batch)
-
-        assert result is True, "Equal timestamps should pass monotonic check (ties allowed)"
-
-    def test_invariants_monotonic_fail(self):
-        """Batch with decreasing timestamp in middle should fail monotonic check."""
-        now = datetime.now(UTC)
-
-        md1 = MarketData(
-            symbol="AAPL",
-            price=Decimal("175.43"),
-            timestamp=now,
-            volume=1000000,
-            source="test",
-        )
-        md2 = MarketData(
-            symbol="AAPL",
-            price=Decimal("175.50"),
-            timestamp=now + timedelta(seconds=20),  # Jumps forward
-            volume=1000100,
-            source="test",
-        )
-        md3 = MarketData(
-            symbol="AAPL",
-            price=Decimal("175.55"),
-            timestamp=now + timedelta(seconds=10),  # Goes backward!
-            volume=1000200,
-            source="test",
-        )
-
-        batch = [md1, md2, md3]
-
-        result = check_monotonic_timestamps(batch)
-
-        assert result is False, "Decreasing timestamp should fail monotonic check"
-
-    def test_invariants_monotonic_empty_batch(self):
-        """Empty batch should pass monotonic check."""
-        result = check_monotonic_timestamps([])
-        assert result is True, "Empty batch should pass monotonic check"
-
-    def test_invariants_monotonic_single_item(self):
-        """Single item batch should pass monotonic check."""
-        md = MarketData(
-            symbol="AAPL",
-            price=Decimal("175.43"),
-            timestamp=datetime.now(UTC),
-            volume=1000000,
-            source="test",
-        )
-
-        result = check_monotonic_timestamps([md])
-
-        assert result is True, "Single item batch should pass monotonic check"
+        assert result is expected, f"Offsets {offsets} should give {expected}"
 
 
 class TestInvariantsUniqueness:
     """Tests for uniqueness invariant checking."""
 
-    @pytest.mark.smoke
-    def test_invariants_uniqueness_pass(self):
-        """Batch with unique trade_ids should pass uniqueness check."""
-        now = datetime.now(UTC)
-
-        td1 = TradeData(
-            trade_id="TRD-001",
-            client_id="CLIENT-001",
-            symbol="AAPL",
-            side="BUY",
-            quantity=Decimal("100"),
-            price=Decimal("175.43"),
-            timestamp=now,
-            venue="NYSE",
-        )
-        td2 = TradeData(
-            trade_id="TRD-002",
-            client_id="CLIENT-001",
-            symbol="AAPL",
-            side="SELL",
-            quantity=Decimal("50"),
-            price=Decimal("176.00"),
-            timestamp=now + timedelta(seconds=10),
-            venue="NYSE",
-        )
-        td3 = TradeData(
-            trade_id="TRD-003",
-            client_id="CLIENT-001",
-            symbol="MSFT",
-            side="BUY",
-            quantity=Decimal("25"),
-            price=Decimal("400.00"),
-            timestamp=now + timedelta(seconds=20),
-            venue="NASDAQ",
-        )
-
-        batch = [td1, td2, td3]
-
-        result = check_uniqueness(batch, key="trade_id", scope_key="client_id")
-
-        assert result is True, "Unique trade_ids should pass uniqueness check"
-
-    def test_invariants_uniqueness_fail(self):
-        """Batch with duplicate trade_id should fail uniqueness check."""
-        now = datetime.now(UTC)
-
-        td1 = TradeData(
-            trade_id="TRD-001",
-            client_id="CLIENT-001",
-            symbol="AAPL",
-            side="BUY",
-            quantity=Decimal("100"),
-            price=Decimal("175.43"),
-            timestamp=now,
-            venue="NYSE",
-        )
-        td2 = TradeData(
-            trade_id="TRD-001",  # Duplicate trade_id!
-            client_id="CLIENT-001",
-            symbol="AAPL",
-            side="SELL",
-            quantity=Decimal("50"),
-            price=Decimal("176.00"),
-            timestamp=now + timedelta(seconds=10),
-            venue="NYSE",
-        )
-
-        batch = [td1, td2]
-
-        result = check_uniqueness(batch, key="trade_id", scope_key="client_id")
-
-        assert result is False, "Duplicate trade_id should fail uniqueness check"
-
-    def test_invariants_uniqueness_different_clients(self):
-        """Same trade_id for different clients should pass (scoped uniqueness)."""
-        now = datetime.now(UTC)
-
-        td1 = TradeData(
-            trade_id="TRD-001",
-            client_id="CLIENT-001",
-            symbol="AAPL",
-            side="BUY",
-            quantity=Decimal("100"),
-            price=Decimal("175.43"),
-            timestamp=now,
-            venue="NYSE",
-        )
-        td2 = TradeData(
-            trade_id="TRD-001",  # Same trade_id but different client
-            client_id="CLIENT-002",  # Different client
-            symbol="AAPL",
-            side="SELL",
-            quantity=Decimal("50"),
-            price=Decimal("176.00"),
-            timestamp=now + timedelta(seconds=10),
-            venue="NYSE",
-        )
-
-        batch = [td1, td2]
-
-        result = check_uniqueness(batch, key="trade_id", scope_key="client_id")
-
-        assert result is True, "Same trade_id for different clients should pass"
-
-    def test_invariants_uniqueness_global(self):
-        """Test global uniqueness (no scope)."""
-        now = datetime.now(UTC)
-
-        td1 = TradeData(
-            trade_id="TRD-001",
-            client_id="CLIENT-001",
-            symbol="AAPL",
-            side="BUY",
-            quantity=Decimal("100"),
-            price=Decimal("175.43"),
-            timestamp=now,
-            venue="NYSE",
-        )
-        td2 = TradeData(
-            trade_id="TRD-001",  # Duplicate globally
-            client_id="CLIENT-002",
-            symbol="AAPL",
-            side="SELL",
-            quantity=Decimal("50"),
-            price=Decimal("176.00"),
-            timestamp=now + timedelta(seconds=10),
-            venue="NYSE",
-        )
-
-        batch = [td1, td2]
-
-        # Without scope_key, should fail because trade_id duplicated globally
-        result = check_uniqueness(batch, key="trade_id")
-
-        assert result is False, "Duplicate trade_id globally should fail"
+    @pytest.mark.parametrize(
+        "overrides, scope_key, expected",
+        [
+            pytest.param({}, "client_id", True, id="unique", marks=pytest.mark.smoke),
+            pytest.param({"trade_id": "TRD-000"}, "client_id", False, id="duplicate"),
+            pytest.param(
+                {"trade_id": "TRD-000", "client_id": "CLIENT-002"},
+                "client_id",
+                True,
+                id="duplicate_other_client",
+            ),
+            pytest.param(
+                {"trade_id": "TRD-000", "client_id": "CLIENT-002"},
+                None,
+                False,
+                id="duplicate_global",
+            ),
+        ],
+    )
+    def test_invariants_uniqueness(self, trade_pool, overrides, scope_key, expected):
+        """Uniqueness of trade_id, optionally scoped by client_id."""
+        batch = list(trade_pool)
+        batch[1] = batch[1].model_copy(update=overrides)
+
+        result = check_uniqueness(batch, key="trade_id", scope_key=scope_key)
+
+        assert result is expected, f"{overrides} with scope {scope_key} should give {expected}"
+
+    def test_invariants_uniqueness_missing_key_skipped(self):
+        """Records without the key field should be skipped, not treated as duplicates."""
+        result = check_uniqueness([object(), object()], key="trade_id", scope_key="client_id")
+
+        assert result is True, "Records missing the key should be ignored"
 
 
 class TestInvariantsCompleteness:
     """Tests for batch completeness invariant checking."""
 
-    def test_invariants_completeness_pass(self):
-        """Non-empty batch with no nulls should pass completeness check."""
-        md = MarketData(
-            symbol="AAPL",
-            price=Decimal("175.43"),
-            timestamp=datetime.now(UTC),
-            volume=1000000,
-            source="test",
-        )
-
-        batch = [md, md]
-
-        result = check_completeness(batch)
-
-        assert result is True, "Complete batch should pass"
-
-    def test_invariants_completeness_fail_empty(self):
-        """Empty batch should fail completeness check."""
-        result = check_completeness([])
-
-        assert result is False, "Empty batch should fail completeness check"
-
-    def test_invariants_completeness_fail_null(self):
-        """Batch with null items should fail completeness check."""
-        md = MarketData(
-            symbol="AAPL",
-            price=Decimal("175.43"),
-            timestamp=datetime.now(UTC),
-            volume=1000000,
-            source="test",
-        )
-
-        batch = [md, None, md]
-
-        result = check_completeness(batch)
-
-        assert result is False, "Batch with None should fail completeness check"
+    @pytest.mark.parametrize(
+        "batch, expected",
+        [
+            pytest.param(BATCH_DUP, True, id="complete"),
+            pytest.param((), False, id="empty"),
+            pytest.param((MD_AAPL, None, MD_AAPL), False, id="null_item"),
+        ],
+    )
+    def test_invariants_completeness(self, batch, expected):
+        """Batches must be non-empty and contain no None items."""
+        assert check_completeness(batch) is expected
 
 
 class TestInvariantsReferentialIntegrity:
     """Tests for referential integrity invariant checking."""
 
-    def test_invariants_referential_integrity_pass(self):
+    def test_invariants_referential_integrity_pass(self, sample_td):
         """Trades with known symbols should pass referential integrity check."""
-        now = datetime.now(UTC)
+        td = sample_td
 
-        td = TradeData(
-            trade_id="TRD-001",
-            client_id="CLIENT-001",
-            symbol="AAPL",
-            side="BUY",
-            quantity=Decimal("100"),
-            price=Decimal("175.43"),
-            timestamp=now,
-            venue="NYSE",
-        )
-
-        known_symbols = {"AAPL", "MSFT", "GOOGL"}
-
-        result = check_referential_integrity([td], known_symbols)
+        result = check_referential_integrity([td], KNOWN_SYMBOLS)
 
         assert result is True, "Trade with known symbol should pass"
 
-    def test_invariants_referential_integrity_warning_mode(self):
+    def test_invariants_referential_integrity_warning_mode(self, sample_td):
         """Trades with unknown symbols should pass in warning mode (default)."""
-        now = datetime.now(UTC)
+        td = sample_td.model_copy(update={"symbol": "UNKNOWN"})
 
-        td = TradeData(
-            trade_id="TRD-001",
-            client_id="CLIENT-001",
-            symbol="UNKNOWN",
-            side="BUY",
-            quantity=Decimal("100"),
-            price=Decimal("175.43"),
-            timestamp=now,
-            venue="NYSE",
-        )
-
-        known_symbols = {"AAPL", "MSFT", "GOOGL"}
-
-        result = check_referential_integrity([td], known_symbols, strict=False)
+        result = check_referential_integrity([td], KNOWN_SYMBOLS, strict=False)
 
         assert result is True, "Warning mode should pass even with unknown symbol"
 
-    def test_invariants_referential_integrity_strict_fail(self):
+    def test_invariants_referential_integrity_strict_fail(self, sample_td):
         """Trades with unknown symbols should fail in strict mode."""
-        now = datetime.now(UTC)
-
-        td = TradeData(
-            trade_id="TRD-001",
-            client_id="CLIENT-001",
-            symbol="UNKNOWN",
-            side="BUY",
-            quantity=Decimal("100"),
-            price=Decimal("175.43"),
-            timestamp=now,
-            venue="NYSE",
-        )
-
-        known_symbols = {"AAPL", "MSFT", "GOOGL"}
+        td = sample_td.model_copy(update={"symbol": "UNKNOWN"})
 
-        result = check_referential_integrity([td], known_symbols, strict=True)
+        result = check_referential_integrity([td], KNOWN_SYMBOLS, strict=True)
 
         assert result is False, "Strict mode should fail with unknown symbol"
+
+    def test_invariants_referential_integrity_reports_unknown(self, caplog):
+        """Unknown symbols should be logged in first-seen order with affected counts."""
+        trades = [
+            TradeData.model_construct(symbol=symbol)
+            for symbol in ("ZZZ", "AAPL", "YYY", "ZZZ")
+        ]
+
+        result = check_referential_integrity(trades, frozenset({"AAPL"}))
+
+        assert result is True, "Warning mode should pass"
+        fields = caplog.records[-1].extra_fields
+        assert fields["unknown_symbols"] == ["ZZZ", "YYY"]
+        assert fields["affected_trade_count"] == 3
+
+    def test_invariants_referential_integrity_strict_logging_disabled(self, caplog):
+        """Strict mode should fail even when the error log is filtered out."""
+        caplog.set_level(logging.CRITICAL, logger="dataspine.validation.invariants")
+        trades = [TradeData.model_construct(symbol="UNKNOWN")]
+
+        assert check_referential_integrity(trades, {"AAPL"}, strict=True) is False
+        assert caplog.records == [], "Nothing should be logged at CRITICAL level"
+
+
+class TestInvariantsAll:
+    """Tests for check_all_invariants."""
+
+    def test_invariants_all_pass_and_fail(self):
+        """Each invariant result should be reported independently."""
+        trades = [
+            TradeData.model_construct(
+                trade_id=trade_id,
+                client_id="CLIENT-001",
+                timestamp=NOW + timedelta(seconds=i),
+            )
+            for i, trade_id in enumerate(["TRD-001", "TRD-002", "TRD-001"])
+        ]
+
+        assert check_all_invariants(trades[:2], scope_key="client_id") == {
+            "monotonic_timestamps": True,
+            "completeness": True,
+            "uniqueness": True,
+        }
+        assert check_all_invariants(trades, scope_key="client_id") == {
+            "monotonic_timestamps": True,
+            "completeness": True,
+            "uniqueness": False,
+        }
@@ -7,13 +7,63 @@ Tests MarketData and TradeData Pydantic models for:
 - Error message clarity
 """
 
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime, timedelta, timezone
 from decimal import Decimal
+from zoneinfo import ZoneInfo
 
 import pytest
 from pydantic import ValidationError
 
-from dataspine.schemas import MarketData, TradeData
+from dataspine.schemas import MarketData, TradeData, _common
+
+# Captured once at import: a recent valid timestamp, and one an hour past the 5min bound
+_NOW = datetime.now(UTC)
+_FUTURE = _NOW + timedelta(hours=1)
+
+# Fixed reference time (same instant as the now_utc fixture)
+_TS_2025 = datetime(2025, 1, 15, 14, 30, 0, tzinfo=UTC)
+
+# Recurring prices/quantities, parsed once at import
+_P_0_0001 = Decimal("0.0001")
+_P_175_43 = Decimal("175.43")
+_P_175_4300 = Decimal("175.4300")
+_P_176_00 = Decimal("176.00")
+_Q_100 = Decimal("100")
+_Q_100_0000 = Decimal("100.0000")
+
+# Valid baselines; invalid-field tests override a single key, and tests of
+# derived properties pass them to model_construct() to skip validation
+VALID_MD_KWARGS = {
+    "symbol": "AAPL",
+    "price": _P_175_43,
+    "timestamp": _NOW,
+    "volume": 1_000_000,
+    "source": "test",
+}
+VALID_TD_KWARGS = {
+    "trade_id": "TRD-001",
+    "client_id": "CLIENT-001",
+    "symbol": "AAPL",
+    "side": "BUY",
+    "quantity": _Q_100,
+    "price": _P_175_43,
+    "timestamp": _NOW,
+    "venue": "NYSE",
+}
+
+
+def _first_error(model, **kwargs):
+    """
+    Build model from kwargs and return the first validation error dict.
+
+    A bare try/except skips pytest.raises' ExceptionInfo bookkeeping, and the
+    url/ctx/input entries tests don't read are left out.
+    """
+    try:
+        model(**kwargs)
+    except ValidationError as e:
+        return e.errors(include_url=False, include_context=False, include_input=False)[0]
+    pytest.fail(f"{model.__name__} should have raised ValidationError")
 
 
 class TestMarketDataValid:
@@ -24,14 +74,14 @@ class TestMarketDataValid:
         """Create valid MarketData instance and verify all fields set correctly."""
         md = MarketData(
             symbol="AAPL",
-            price=Decimal("175.4300"),
-            timestamp=datetime(2025, 1, 15, 14, 30, 0, tzinfo=UTC),
+            price=_P_175_4300,
+            timestamp=_TS_2025,
             volume=2500000,
             source="iex_cloud",
         )
 
         assert md.symbol == "AAPL", "Symbol should be AAPL"
-        assert md.price == Decimal("175.4300"), "Price should be 175.4300"
+        assert md.price == _P_175_4300, "Price should be 175.4300"
         assert md.volume == 2500000, "Volume should be 2500000"
         assert md.source == "iex_cloud", "Source should be iex_cloud"
         assert md.timestamp.tzinfo is not None, "Timestamp should be timezone-aware"
@@ -41,7 +91,7 @@ class TestMarketDataValid:
         md = MarketData(
             symbol="BRK.B",
             price=Decimal("450.00"),
-            timestamp=datetime.now(UTC),
+            timestamp=_NOW,
             volume=100000,
             source="polygon_io",
         )
@@ -52,227 +102,260 @@ class TestMarketDataValid:
         """Test MarketData with minimum valid values."""
         md = MarketData(
             symbol="A",
-            price=Decimal("0.0001"),
+            price=_P_0_0001,
             timestamp=datetime(2000, 1, 1, 0, 0, 0, tzinfo=UTC),
             volume=0,
             source="x",
         )
 
         assert md.symbol == "A", "Single character symbol should be valid"
-        assert md.price == Decimal("0.0001"), "Small positive price should be valid"
+        assert md.price == _P_0_0001, "Small positive price should be valid"
         assert md.volume == 0, "Zero volume should be valid"
 
+    def test_market_data_frozen(self):
+        """MarketData should be immutable and hashable; use model_copy to change fields."""
+        md = MarketData(
+            symbol="AAPL",
+            price=_P_175_43,
+            timestamp=_TS_2025,
+            volume=1000,
+            source="test",
+        )
 
-class TestMarketDataInvalidSymbol:
-    """Tests for MarketData symbol validation."""
+        with pytest.raises(ValidationError):
+            md.price = _P_176_00
 
-    @pytest.mark.smoke
-    def test_market_data_invalid_symbol_lowercase(self):
-        """Lowercase symbol should be rejected."""
-        with pytest.raises(ValidationError) as exc_info:
-            MarketData(
-                symbol="aapl",
-                price=Decimal("175.43"),
-                timestamp=datetime.now(UTC),
-                volume=1000000,
-                source="test",
-            )
+        updated = md.model_copy(update={"price": _P_176_00})
+        assert updated.price == _P_176_00, "model_copy should apply the update"
+        assert len({md, md}) == 1, "Frozen instances should be hashable"
 
-        errors = exc_info.value.errors()
-        assert len(errors) >= 1, "Should have at least one error"
-        error_msg = str(errors[0]["msg"]).lower()
-        assert "uppercase" in error_msg or "symbol" in error_msg, (
-            f"Error should mention symbol case issue, got: {errors[0]['msg']}"
-        )
+    def test_market_data_extra_field_rejected(self):
+        """Unknown fields should be rejected."""
+        error = _first_error(MarketData, **VALID_MD_KWARGS, exchange="NYSE")
 
-    def test_market_data_invalid_symbol_too_long(self):
-        """Symbol longer than 10 characters should be rejected."""
-        with pytest.raises(ValidationError) as exc_info:
-            MarketData(
-                symbol="ABCDEFGHIJKLMNO",  # 15 characters
-                price=Decimal("100.00"),
-                timestamp=datetime.now(UTC),
-                volume=1000,
-                source="test",
-            )
+        assert error["type"] == "extra_forbidden", f"Should reject extra field, got: {error}"
 
-        errors = exc_info.value.errors()
-        assert len(errors) >= 1, "Should have at least one error"
-        error_msg = str(errors[0]["msg"]).lower()
-        assert "character" in error_msg or "1-10" in error_msg, (
-            f"Error should mention character limit, got: {errors[0]['msg']}"
-        )
+    def test_market_data_price_e4(self):
+        """price_e4 should expose the price as an int scaled by 10_000."""
+        md = MarketData.model_construct(**VALID_MD_KWARGS)
 
-    def test_market_data_invalid_symbol_empty(self):
-        """Empty symbol should be rejected."""
-        with pytest.raises(ValidationError) as exc_info:
-            MarketData(
-                symbol="",
-                price=Decimal("100.00"),
-                timestamp=datetime.now(UTC),
-                volume=1000,
-                source="test",
-            )
+        assert md.price_e4 == 1754300, "175.43 should scale to 1754300"
+
+    def test_market_data_content_hash(self):
+        """content_hash should follow record content, including after model_copy."""
+        md = MarketData.model_construct(**VALID_MD_KWARGS)
 
-        errors = exc_info.value.errors()
-        assert len(errors) >= 1, "Should have at least one error"
+        assert md.content_hash == md.model_copy().content_hash, "Equal content should hash equal"
+        assert md.content_hash != md.model_copy(update={"volume": 1001}).content_hash
+        assert 0 <= md.content_hash < 2**64, "content_hash should be an unsigned 64-bit int"
 
-    def test_market_data_invalid_symbol_whitespace(self):
-        """Symbol with whitespace should be rejected."""
-        with pytest.raises(ValidationError) as exc_info:
+    def test_market_data_interned_symbol_and_source(self):
+        """Equal symbols and sources should share one str object and symbol id."""
+        rows = [
             MarketData(
-                symbol="AA PL",
-                price=Decimal("100.00"),
-                timestamp=datetime.now(UTC),
+                symbol="".join(["MS", "FT"]),
+                price=Decimal("410.00"),
+                timestamp=_TS_2025,
                 volume=1000,
-                source="test",
+                source="".join(["iex_", "cloud"]),
             )
+            for _ in range(2)
+        ]
 
-        errors = exc_info.value.errors()
-        assert len(errors) >= 1, "Should have at least one error"
-
+        assert rows[0].symbol is rows[1].symbol, "Symbols should be interned"
+        assert rows[0].source is rows[1].source, "Sources should be interned"
+        assert rows[0].symbol_id == rows[1].symbol_id, "symbol_id should be stable"
+        assert isinstance(rows[0].symbol_id, int), "symbol_id should be an int"
 
-class TestMarketDataInvalidPrice:
-    """Tests for MarketData price validation."""
+    def test_market_data_intern_table_capped(self, monkeypatch):
+        """The intern table should stop growing at its cap; new values still validate."""
+        cap = len(_common._INTERN_TABLE) + 2
+        monkeypatch.setattr(_common, "_INTERN_MAX", cap)
 
-    @pytest.mark.smoke
-    def test_market_data_invalid_price_negative(self):
-        """Negative price should be rejected."""
-        with pytest.raises(ValidationError) as exc_info:
+        rows = [
             MarketData(
-                symbol="AAPL",
-                price=Decimal("-10.50"),
-                timestamp=datetime.now(UTC),
-                volume=1000000,
+                symbol=f"CAP{i}",
+                price=Decimal("410.00"),
+                timestamp=_TS_2025,
+                volume=1000,
                 source="test",
             )
+            for i in range(5)
+        ]
 
-        errors = exc_info.value.errors()
-        assert len(errors) >= 1, "Should have at least one error"
-        error_msg = str(errors[0]["msg"]).lower()
-        assert "positive" in error_msg or "price" in error_msg, (
-            f"Error should mention price must be positive, got: {errors[0]['msg']}"
-        )
-
-    def test_market_data_invalid_price_zero(self):
-        """Zero price should be rejected."""
-        with pytest.raises(ValidationError) as exc_info:
-            MarketData(
-                symbol="AAPL",
-                price=Decimal("0"),
-                timestamp=datetime.now(UTC),
-                volume=1000000,
-                source="test",
-            )
+        assert len(_common._INTERN_TABLE) == cap, "Intern table should not grow past its cap"
+        assert [md.symbol for md in rows] == [f"CAP{i}" for i in range(5)]
 
-        errors = exc_info.value.errors()
-        assert len(errors) >= 1, "Should have at least one error"
-        error_msg = str(errors[0]["msg"]).lower()
-        assert "positive" in error_msg or "price" in error_msg, (
-            f"Error should mention price must be positive, got: {errors[0]['msg']}"
+    def test_market_data_price_coerced_from_str_and_int(self):
+        """String and int prices should be parsed to Decimal."""
+        md_str = MarketData(
+            symbol="AAPL",
+            price="175.4300",
+            timestamp=_NOW,
+            volume=1000000,
+            source="test",
+        )
+        md_int = MarketData(
+            symbol="AAPL",
+            price=175,
+            timestamp=_NOW,
+            volume=1000000,
+            source="test",
         )
 
-    def test_market_data_invalid_price_too_many_decimals(self):
-        """Price with more than 4 decimal places should be rejected."""
-        with pytest.raises(ValidationError) as exc_info:
-            MarketData(
-                symbol="AAPL",
-                price=Decimal("100.123456"),
-                timestamp=datetime.now(UTC),
-                volume=1000000,
-                source="test",
-            )
+        assert md_str.price == _P_175_4300, "String price should parse to Decimal"
+        assert md_int.price == Decimal("175"), "Int price should parse to Decimal"
+
+    def test_market_data_valid_timestamp_zoneinfo_utc(self):
+        """UTC expressed via a tzinfo other than timezone.utc should be accepted."""
+        ts = datetime(2025, 1, 15, 14, 30, 0, tzinfo=ZoneInfo("UTC"))
 
-        errors = exc_info.value.errors()
-        assert len(errors) >= 1, "Should have at least one error"
-        error_msg = str(errors[0]["msg"]).lower()
-        assert "decimal" in error_msg, (
-            f"Error should mention decimal places, got: {errors[0]['msg']}"
+        md = MarketData(
+            symbol="AAPL",
+            price=_P_175_43,
+            timestamp=ts,
+            volume=1000000,
+            source="test",
         )
 
+        assert md.timestamp == ts, "ZoneInfo('UTC') timestamp should be accepted"
+
+
+MD_INVALID_CASES = [
+    pytest.param("symbol", "aapl", "string_pattern_mismatch", "pattern", marks=pytest.mark.smoke),
+    ("symbol", "ABCDEFGHIJKLMNO", "string_too_long", "character"),
+    ("symbol", "", "string_too_short", "character"),
+    ("symbol", "AA PL", "string_pattern_mismatch", "pattern"),
+    pytest.param("price", Decimal("-10.50"), "greater_than", "greater than", marks=pytest.mark.smoke),
+    ("price", Decimal("0"), "greater_than", "greater than"),
+    ("price", Decimal("100.123456"), "value_error", "decimal places, got 6"),
+    ("price", "100.12345", "value_error", "decimal places, got 5"),
+    ("price", Decimal("175.430000"), "value_error", "decimal places, got 6"),
+    ("timestamp", datetime(2025, 1, 15, 14, 30, 0), "value_error", "timezone-aware"),
+    ("timestamp", _FUTURE, "value_error", "future"),
+    ("timestamp", datetime(1999, 12, 31, 23, 59, 59, tzinfo=UTC), "value_error", "2000"),
+    (
+        "timestamp",
+        datetime(2025, 1, 15, 14, 30, 0, tzinfo=timezone(timedelta(hours=1))),
+        "value_error",
+        "utc",
+    ),
+    ("volume", -100, "greater_than_equal", "greater than or equal"),
+]
+
+
+class TestMarketDataInvalid:
+    """Tests for MarketData field validation failures."""
+
+    @pytest.mark.parametrize("field,value,error_type,msg_part", MD_INVALID_CASES)
+    def test_market_data_invalid(self, field, value, error_type, msg_part):
+        """Each invalid field value should be rejected with an error on that field."""
+        error = _first_error(MarketData, **{**VALID_MD_KWARGS, field: value})
+
+        assert error["loc"] == (field,), f"Error should be on {field}, got: {error}"
+        assert error["type"] == error_type, f"Expected {error_type}, got: {error}"
+        assert msg_part in error["msg"].lower(), f"Error should mention {msg_part!r}, got: {error}"
+
+
+class TestMarketDataBatch:
+    """Tests for MarketData batch validation."""
+
+    def test_market_data_validate_many(self):
+        """Batch of valid rows should produce MarketData instances."""
+        rows = [
+            {
+                "symbol": "AAPL",
+                "price": _P_175_43,
+                "timestamp": _TS_2025,
+                "volume": 1000000,
+                "source": "test",
+            },
+            {
+                "symbol": "MSFT",
+                "price": Decimal("400.00"),
+                "timestamp": datetime(2025, 1, 15, 14, 31, 0, tzinfo=UTC),
+                "volume": 500000,
+                "source": "test",
+            },
+        ]
+
+        batch = MarketData.validate_many(rows)
+
+        assert [md.symbol for md in batch] == ["AAPL", "MSFT"]
+        assert all(isinstance(md, MarketData) for md in batch)
+
+    def test_market_data_validate_many_invalid_row(self):
+        """A single invalid row should fail the whole batch."""
+        rows = [
+            {
+                "symbol": "aapl",
+                "price": _P_175_43,
+                "timestamp": _TS_2025,
+                "volume": 1000000,
+                "source": "test",
+            },
+        ]
+
+        with pytest.raises(ValidationError):
+            MarketData.validate_many(rows)
+
+    def test_market_data_validate_many_json(self):
+        """JSON array should be parsed and validated in one call."""
+        raw = (
+            b'[{"symbol": "AAPL", "price": "175.43", '
+            b'"timestamp": "2025-01-15T14:30:00Z", "volume": 1000000, "source": "test"}]'
+        )
 
-class TestMarketDataInvalidTimestamp:
-    """Tests for MarketData timestamp validation."""
+        batch = MarketData.validate_many_json(raw)
 
-    def test_market_data_invalid_timestamp_naive(self):
-        """Naive datetime (no timezone) should be rejected."""
-        with pytest.raises(ValidationError) as exc_info:
-            MarketData(
-                symbol="AAPL",
-                price=Decimal("175.43"),
-                timestamp=datetime(2025, 1, 15, 14, 30, 0),  # No tzinfo
-                volume=1000000,
-                source="test",
-            )
+        assert len(batch) == 1
+        assert batch[0].price == _P_175_43
+        assert batch[0].timestamp == _TS_2025
 
-        errors = exc_info.value.errors()
-        assert len(errors) >= 1, "Should have at least one error"
-        error_msg = str(errors[0]["msg"]).lower()
-        assert "timezone" in error_msg or "aware" in error_msg, (
-            f"Error should mention timezone, got: {errors[0]['msg']}"
+    def test_market_data_dumps_batch_round_trip(self):
+        """dumps_batch output should validate back to equal instances."""
+        md = MarketData(
+            symbol="AAPL",
+            price=_P_175_43,
+            timestamp=_TS_2025,
+            volume=1000000,
+            source="test",
         )
 
-    def test_market_data_invalid_timestamp_future(self):
-        """Timestamp more than 5 minutes in future should be rejected."""
-        future_time = datetime.now(UTC) + timedelta(hours=1)
-
-        with pytest.raises(ValidationError) as exc_info:
-            MarketData(
-                symbol="AAPL",
-                price=Decimal("175.43"),
-                timestamp=future_time,
-                volume=1000000,
-                source="test",
-            )
+        raw = MarketData.dumps_batch([md, md])
 
-        errors = exc_info.value.errors()
-        assert len(errors) >= 1, "Should have at least one error"
-        error_msg = str(errors[0]["msg"]).lower()
-        assert "future" in error_msg or "5min" in error_msg or "5 min" in error_msg, (
-            f"Error should mention future timestamp, got: {errors[0]['msg']}"
+        assert MarketData.validate_many_json(raw) == [md, md]
+        assert md.to_json() == (
+            b'{"symbol":"AAPL","price":"175.43","timestamp":"2025-01-15T14:30:00Z",'
+            b'"volume":1000000,"source":"test"}'
         )
 
-    def test_market_data_invalid_timestamp_too_old(self):
-        """Timestamp before year 2000 should be rejected."""
-        old_time = datetime(1999, 12, 31, 23, 59, 59, tzinfo=UTC)
 
-        with pytest.raises(ValidationError) as exc_info:
-            MarketData(
-                symbol="AAPL",
-                price=Decimal("175.43"),
-                timestamp=old_time,
-                volume=1000000,
-                source="test",
-            )
+class TestMarketDataTrusted:
+    """Tests for MarketData trusted-input constructors."""
 
-        errors = exc_info.value.errors()
-        assert len(errors) >= 1, "Should have at least one error"
-        error_msg = str(errors[0]["msg"]).lower()
-        assert "2000" in error_msg or "year" in error_msg, (
-            f"Error should mention year 2000, got: {errors[0]['msg']}"
+    def test_market_data_from_trusted(self):
+        """from_trusted should set fields without running validation."""
+        md = MarketData.from_trusted(
+            symbol="aapl",  # would fail validation
+            price=_P_175_43,
+            timestamp=_TS_2025,
+            volume=1000000,
+            source="test",
         )
 
+        assert md.symbol == "aapl", "Trusted input should not be validated"
 
-class TestMarketDataInvalidVolume:
-    """Tests for MarketData volume validation."""
+    def test_market_data_from_row(self):
+        """from_row should map cursor columns onto fields."""
+        columns = ("symbol", "price", "timestamp", "volume", "source")
+        row = ("AAPL", _P_175_43, _TS_2025, 1000000, "db")
 
-    def test_market_data_invalid_volume_negative(self):
-        """Negative volume should be rejected."""
-        with pytest.raises(ValidationError) as exc_info:
-            MarketData(
-                symbol="AAPL",
-                price=Decimal("175.43"),
-                timestamp=datetime.now(UTC),
-                volume=-100,
-                source="test",
-            )
+        md = MarketData.from_row(row, columns)
 
-        errors = exc_info.value.errors()
-        assert len(errors) >= 1, "Should have at least one error"
-        error_msg = str(errors[0]["msg"]).lower()
-        assert "volume" in error_msg or ">= 0" in error_msg or "negative" in error_msg, (
-            f"Error should mention volume constraint, got: {errors[0]['msg']}"
-        )
+        assert md.symbol == "AAPL"
+        assert md.price == _P_175_43
+        assert md.source == "db"
 
 
 class TestTradeDataValid:
@@ -286,8 +369,8 @@ class TestTradeDataValid:
             client_id="CLIENT-001",
             symbol="AAPL",
             side="BUY",
-            quantity=Decimal("100.0000"),
-            price=Decimal("175.4300"),
+            quantity=_Q_100_0000,
+            price=_P_175_4300,
             timestamp=datetime(2025, 1, 15, 14, 30, 15, tzinfo=UTC),
             venue="NASDAQ",
         )
@@ -296,9 +379,11 @@ class TestTradeDataValid:
         assert td.client_id == "CLIENT-001", "client_id should match"
         assert td.symbol == "AAPL", "Symbol should be AAPL"
         assert td.side == "BUY", "Side should be BUY"
-        assert td.quantity == Decimal("100.0000"), "Quantity should match"
-        assert td.price == Decimal("175.4300"), "Price should match"
+        assert td.quantity == _Q_100_0000, "Quantity should match"
+        assert td.price == _P_175_4300, "Price should match"
         assert td.venue == "NASDAQ", "Venue should be NASDAQ"
+        assert td.quantity_e4 == 1000000, "quantity_e4 should scale by 10_000"
+        assert td.price_e4 == 1754300, "price_e4 should scale by 10_000"
 
     def test_trade_data_valid_sell(self):
         """Test TradeData with SELL side."""
@@ -309,131 +394,51 @@ class TestTradeDataValid:
             side="SELL",
             quantity=Decimal("50.0000"),
             price=Decimal("400.0000"),
-            timestamp=datetime.now(UTC),
+            timestamp=_NOW,
             venue="NYSE",
         )
 
         assert td.side == "SELL", "Side should be SELL"
 
 
-class TestTradeDataInvalidSide:
-    """Tests for TradeData side validation."""
+TD_INVALID_CASES = [
+    pytest.param("side", "buy", "literal_error", "buy", marks=pytest.mark.smoke),
+    ("side", "HOLD", "literal_error", "buy"),
+    ("quantity", Decimal("0"), "greater_than", "greater than"),
+    ("quantity", Decimal("-100"), "greater_than", "greater than"),
+    ("quantity", Decimal("100.00000"), "value_error", "quantity must have at most 4"),
+    ("trade_id", "", "string_pattern_mismatch", "pattern"),
+    ("venue", "", "string_pattern_mismatch", "pattern"),
+    ("client_id", "   ", "string_pattern_mismatch", "pattern"),
+]
 
-    @pytest.mark.smoke
-    def test_trade_data_invalid_side_lowercase(self):
-        """Lowercase side should be rejected."""
-        with pytest.raises(ValidationError) as exc_info:
-            TradeData(
-                trade_id="TRD-001",
-                client_id="CLIENT-001",
-                symbol="AAPL",
-                side="buy",  # lowercase
-                quantity=Decimal("100"),
-                price=Decimal("175.43"),
-                timestamp=datetime.now(UTC),
-                venue="NYSE",
-            )
 
-        errors = exc_info.value.errors()
-        assert len(errors) >= 1, "Should have at least one error"
-        error_msg = str(errors[0]["msg"]).lower()
-        assert "buy" in error_msg or "sell" in error_msg or "side" in error_msg, (
-            f"Error should mention valid side values, got: {errors[0]['msg']}"
-        )
+class TestTradeDataInvalid:
+    """Tests for TradeData field validation failures."""
 
-    def test_trade_data_invalid_side_hold(self):
-        """Invalid side value 'HOLD' should be rejected."""
-        with pytest.raises(ValidationError) as exc_info:
-            TradeData(
-                trade_id="TRD-001",
-                client_id="CLIENT-001",
-                symbol="AAPL",
-                side="HOLD",
-                quantity=Decimal("100"),
-                price=Decimal("175.43"),
-                timestamp=datetime.now(UTC),
-                venue="NYSE",
-            )
+    @pytest.mark.parametrize("field,value,error_type,msg_part", TD_INVALID_CASES)
+    def test_trade_data_invalid(self, field, value, error_type, msg_part):
+        """Each invalid field value should be rejected with an error on that field."""
+        error = _first_error(TradeData, **{**VALID_TD_KWARGS, field: value})
 
-        errors = exc_info.value.errors()
-        assert len(errors) >= 1, "Should have at least one error"
-
-
-class TestTradeDataInvalidQuantity:
-    """Tests for TradeData quantity validation."""
-
-    def test_trade_data_invalid_quantity_zero(self):
-        """Zero quantity should be rejected."""
-        with pytest.raises(ValidationError) as exc_info:
-            TradeData(
-                trade_id="TRD-001",
-                client_id="CLIENT-001",
-                symbol="AAPL",
-                side="BUY",
-                quantity=Decimal("0"),
-                price=Decimal("175.43"),
-                timestamp=datetime.now(UTC),
-                venue="NYSE",
-            )
+        assert error["loc"] == (field,), f"Error should be on {field}, got: {error}"
+        assert error["type"] == error_type, f"Expected {error_type}, got: {error}"
+        assert msg_part in error["msg"].lower(), f"Error should mention {msg_part!r}, got: {error}"
 
-        errors = exc_info.value.errors()
-        assert len(errors) >= 1, "Should have at least one error"
-        error_msg = str(errors[0]["msg"]).lower()
-        assert "quantity" in error_msg or "positive" in error_msg, (
-            f"Error should mention quantity must be positive, got: {errors[0]['msg']}"
-        )
 
-    def test_trade_data_invalid_quantity_negative(self):
-        """Negative quantity should be rejected."""
-        with pytest.raises(ValidationError) as exc_info:
-            TradeData(
-                trade_id="TRD-001",
-                client_id="CLIENT-001",
-                symbol="AAPL",
-                side="BUY",
-                quantity=Decimal("-100"),
-                price=Decimal("175.43"),
-                timestamp=datetime.now(UTC),
-                venue="NYSE",
-            )
+class TestTradeDataBatch:
+    """Tests for TradeData batch validation."""
 
-        errors = exc_info.value.errors()
-        assert len(errors) >= 1, "Should have at least one error"
-
-
-class TestTradeDataInvalidRequired:
-    """Tests for TradeData required field validation."""
-
-    def test_trade_data_invalid_trade_id_empty(self):
-        """Empty trade_id should be rejected."""
-        with pytest.raises(ValidationError) as exc_info:
-            TradeData(
-                trade_id="",
-                client_id="CLIENT-001",
-                symbol="AAPL",
-                side="BUY",
-                quantity=Decimal("100"),
-                price=Decimal("175.43"),
-                timestamp=datetime.now(UTC),
-                venue="NYSE",
-            )
+    def test_trade_data_validate_many_json(self):
+        """JSON array of trades should be parsed and validated in one call."""
+        raw = (
+            b'[{"trade_id": "TRD-001", "client_id": "CLIENT-001", "symbol": "AAPL", '
+            b'"side": "BUY", "quantity": "100", "price": "175.43", '
+            b'"timestamp": "2025-01-15T14:30:15Z", "venue": "NYSE"}]'
+        )
 
-        errors = exc_info.value.errors()
-        assert len(errors) >= 1, "Should have at least one error"
-
-    def test_trade_data_invalid_venue_empty(self):
-        """Empty venue should be rejected."""
-        with pytest.raises(ValidationError) as exc_info:
-            TradeData(
-                trade_id="TRD-001",
-                client_id="CLIENT-001",
-                symbol="AAPL",
-                side="BUY",
-                quantity=Decimal("100"),
-                price=Decimal("175.43"),
-                timestamp=datetime.now(UTC),
-                venue="",
-            )
+        batch = TradeData.validate_many_json(raw)
 
-        errors = exc_info.value.errors()
-        assert len(errors) >= 1, "Should have at least one error"
+        assert len(batch) == 1
+        assert batch[0].side == "BUY"
+        assert batch[0].quantity == _Q_100
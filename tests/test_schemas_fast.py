@@ -0,0 +1,130 @@
+"""
+Pytest test suite for the msgspec schema mirrors.
+
+Tests MarketDataFast and TradeDataFast for:
+- Batch decoding of valid JSON
+- Contract enforcement matching the pydantic schemas
+- Conversion to the pydantic models
+"""
+
+import os
+import time
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import pytest
+
+msgspec = pytest.importorskip("msgspec")
+
+from dataspine.schemas import MarketData, TradeData  # noqa: E402
+from dataspine.schemas._fast import decode_market_batch, decode_trade_batch  # noqa: E402
+
+MARKET_ROW = (
+    b'{"symbol": "AAPL", "price": "175.43", "timestamp": "2025-01-15T14:30:00Z", '
+    b'"volume": 1000000, "source": "test"}'
+)
+
+
+def _best_of(fn, arg, repeat=3):
+    """Fastest wall time of fn(arg) over repeat runs, after one warm-up call."""
+    fn(arg)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(arg)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+class TestMarketDataFast:
+    """Tests for MarketDataFast decoding."""
+
+    def test_decode_market_batch_valid(self):
+        """Valid JSON rows should decode and convert to MarketData."""
+        rows = decode_market_batch(b"[" + MARKET_ROW + b"]")
+
+        md = rows[0].to_pydantic()
+
+        assert isinstance(md, MarketData)
+        assert md.price == Decimal("175.43")
+        assert md.timestamp == datetime(2025, 1, 15, 14, 30, 0, tzinfo=UTC)
+
+    @pytest.mark.parametrize(
+        "field, value",
+        [
+            (b'"symbol": "AAPL"', b'"symbol": "aapl"'),
+            (b'"symbol": "AAPL"', b'"symbol": "AAPL\\n"'),
+            (b'"price": "175.43"', b'"price": "-1"'),
+            (b'"price": "175.43"', b'"price": "1.23456"'),
+            (b'"price": "175.43"', b'"price": "1E-10000000"'),
+            (b'"price": "175.43"', b'"price": "175.430000"'),
+            (b'"2025-01-15T14:30:00Z"', b'"2025-01-15T14:30:00"'),
+            (b'"2025-01-15T14:30:00Z"', b'"1999-12-31T23:59:59Z"'),
+            (b'"volume": 1000000', b'"volume": -1'),
+            (b'"source": "test"', b'"source": " "'),
+        ],
+    )
+    def test_decode_market_batch_invalid(self, field, value):
+        """Rows violating a contract should be rejected."""
+        with pytest.raises(msgspec.ValidationError):
+            decode_market_batch(b"[" + MARKET_ROW.replace(field, value) + b"]")
+
+    def test_decode_market_batch_huge_exponent_price(self):
+        """A whole-number price with a huge exponent should be accepted, as by pydantic."""
+        row = MARKET_ROW.replace(b'"price": "175.43"', b'"price": "1E+10000000"')
+
+        rows = decode_market_batch(b"[" + row + b"]")
+
+        assert rows[0].price == Decimal("1E+10000000")
+
+    def test_decode_market_batch_price_places_message(self):
+        """Decimal places in the error should be exact beyond 28 digits."""
+        row = MARKET_ROW.replace(
+            b'"price": "175.43"', b'"price": "12345678901234567890123456.12345"'
+        )
+
+        with pytest.raises(msgspec.ValidationError, match="got 5"):
+            decode_market_batch(b"[" + row + b"]")
+
+    @pytest.mark.slow
+    @pytest.mark.skipif(
+        not os.environ.get("DATASPINE_PERF_TESTS"),
+        reason="wall-clock comparison; opt in with DATASPINE_PERF_TESTS=1 (make perf)",
+    )
+    def test_decode_market_batch_faster_than_pydantic(self):
+        """Regression fence: the msgspec path must stay ahead of validate_many_json."""
+        raw = b"[" + b",".join([MARKET_ROW] * 10_000) + b"]"
+
+        fast = _best_of(decode_market_batch, raw)
+        slow = _best_of(MarketData.validate_many_json, raw)
+
+        assert fast < slow, f"msgspec decode took {fast:.4f}s vs pydantic {slow:.4f}s"
+
+
+class TestTradeDataFast:
+    """Tests for TradeDataFast decoding."""
+
+    def test_decode_trade_batch_valid(self):
+        """Valid JSON trades should decode and convert to TradeData."""
+        raw = (
+            b'[{"trade_id": "TRD-001", "client_id": "CLIENT-001", "symbol": "AAPL", '
+            b'"side": "SELL", "quantity": "100", "price": "175.43", '
+            b'"timestamp": "2025-01-15T14:30:15Z", "venue": "NYSE"}]'
+        )
+
+        td = decode_trade_batch(raw)[0].to_pydantic()
+
+        assert isinstance(td, TradeData)
+        assert td.side == "SELL"
+        assert td.quantity == Decimal("100")
+
+    def test_decode_trade_batch_invalid_side(self):
+        """Side other than BUY/SELL should be rejected."""
+        raw = (
+            b'[{"trade_id": "TRD-001", "client_id": "CLIENT-001", "symbol": "AAPL", '
+            b'"side": "HOLD", "quantity": "100", "price": "175.43", '
+            b'"timestamp": "2025-01-15T14:30:15Z", "venue": "NYSE"}]'
+        )
+
+        with pytest.raises(msgspec.ValidationError):
+            decode_trade_batch(raw)
@@ -0,0 +1,201 @@
+"""
+Pytest test suite for columnar batch validation.
+
+Tests validate_market_batch and validate_trade_batch for:
+- Valid tables passing through unchanged
+- Per-column contract violations reported with the first bad row
+- Column type checks (decimal prices, UTC timestamps)
+
+Tests validate_market_data_batch and validate_trade_data_batch for:
+- Row masks and complete (row, contract) violation lists
+
+Tests check_monotonic_timestamps_batch for:
+- Agreement with the list-based check_monotonic_timestamps
+"""
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from dataspine.validation.batch import validate_market_batch, validate_trade_batch  # noqa: E402
+from dataspine.validation.contracts_batch import (  # noqa: E402
+    validate_market_data_batch,
+    validate_trade_data_batch,
+)
+from dataspine.validation.invariants_batch import check_monotonic_timestamps_batch  # noqa: E402
+
+TS_TYPE = pa.timestamp("us", tz="UTC")
+PRICE_TYPE = pa.decimal128(18, 4)
+TS = datetime(2025, 1, 15, 14, 30, 0, tzinfo=UTC)
+
+
+def market_table(**overrides):
+    """Build a two-row market data table, replacing any column given."""
+    columns = {
+        "symbol": pa.array(["AAPL", "BRK.B"]),
+        "price": pa.array([Decimal("175.43"), Decimal("450.00")], type=PRICE_TYPE),
+        "timestamp": pa.array([TS, TS], type=TS_TYPE),
+        "volume": pa.array([1000, 0], type=pa.int64()),
+        "source": pa.array(["test", "test"]),
+    }
+    columns.update(overrides)
+    return pa.table(columns)
+
+
+def trade_table(**overrides):
+    """Build a two-row trade data table, replacing any column given."""
+    columns = {
+        "trade_id": pa.array(["T1", "T2"]),
+        "client_id": pa.array(["C1", "C1"]),
+        "symbol": pa.array(["AAPL", "AAPL"]),
+        "side": pa.array(["BUY", "SELL"]),
+        "quantity": pa.array([Decimal("100"), Decimal("5.5")], type=PRICE_TYPE),
+        "price": pa.array([Decimal("175.43"), Decimal("175.44")], type=PRICE_TYPE),
+        "timestamp": pa.array([TS, TS], type=TS_TYPE),
+        "venue": pa.array(["NYSE", "NYSE"]),
+    }
+    columns.update(overrides)
+    return pa.table(columns)
+
+
+class TestValidateMarketBatch:
+    """Tests for validate_market_batch."""
+
+    def test_valid_table_returned_unchanged(self):
+        """A valid table should be returned as-is."""
+        table = market_table()
+
+        assert validate_market_batch(table) is table
+
+    @pytest.mark.parametrize(
+        "column, values, code",
+        [
+            ("symbol", pa.array(["AAPL", "aapl"]), "SYMBOL_FORMAT"),
+            ("symbol", pa.array(["AAPL", "TOOLONGSYMBOL"]), "SYMBOL_FORMAT"),
+            ("price", pa.array([Decimal("1"), Decimal("0")], type=PRICE_TYPE), "PRICE_VALIDITY"),
+            ("volume", pa.array([1, -1], type=pa.int64()), "SCHEMA"),
+            ("source", pa.array(["test", "   "]), "SCHEMA"),
+            ("timestamp", pa.array([TS, datetime(1999, 12, 31, tzinfo=UTC)], type=TS_TYPE), "TIMESTAMP_VALIDITY"),
+        ],
+    )
+    def test_invalid_row_reported(self, column, values, code):
+        """The first bad row should be reported with its contract code and index."""
+        with pytest.raises(ValueError, match=rf"^{code}: invalid {column} at row 1"):
+            validate_market_batch(market_table(**{column: values}))
+
+    def test_price_with_too_many_decimal_places(self):
+        """Prices with more than 4 decimal places should be rejected."""
+        prices = pa.array([Decimal("1.00001"), Decimal("1.0000")], type=pa.decimal128(18, 5))
+
+        with pytest.raises(ValueError, match="PRICE_VALIDITY: invalid price at row 0"):
+            validate_market_batch(market_table(price=prices))
+
+    def test_null_counts_as_violation(self):
+        """Null values should fail validation."""
+        with pytest.raises(ValueError, match="SYMBOL_FORMAT: invalid symbol at row 0"):
+            validate_market_batch(market_table(symbol=pa.array([None, "AAPL"], type=pa.string())))
+
+    def test_naive_timestamp_column_rejected(self):
+        """Timestamp columns without a timezone should be rejected."""
+        naive = pa.array([TS.replace(tzinfo=None)] * 2, type=pa.timestamp("us"))
+
+        with pytest.raises(ValueError, match="timezone-aware"):
+            validate_market_batch(market_table(timestamp=naive))
+
+    def test_missing_column_rejected(self):
+        """Missing columns should be reported as REQUIRED_FIELDS."""
+        with pytest.raises(ValueError, match="REQUIRED_FIELDS"):
+            validate_market_batch(market_table().drop_columns(["source"]))
+
+
+class TestValidateTradeBatch:
+    """Tests for validate_trade_batch."""
+
+    def test_valid_table_returned_unchanged(self):
+        """A valid table should be returned as-is."""
+        table = trade_table()
+
+        assert validate_trade_batch(table) is table
+
+    def test_invalid_side_reported(self):
+        """Sides other than BUY/SELL should be rejected."""
+        with pytest.raises(ValueError, match="TRADE_SPECIFIC: invalid side at row 1"):
+            validate_trade_batch(trade_table(side=pa.array(["BUY", "buy"])))
+
+
+class TestContractsBatch:
+    """Tests for validate_market_data_batch and validate_trade_data_batch."""
+
+    def test_valid_market_table(self):
+        """A valid table should produce an all-True mask and no violations."""
+        valid, violations = validate_market_data_batch(market_table())
+
+        assert valid.to_pylist() == [True, True]
+        assert violations == []
+
+    def test_market_violations_collected(self):
+        """Every violation should be reported, ordered by row."""
+        table = market_table(
+            symbol=pa.array(["aapl", "AAPL"]),
+            price=pa.array([Decimal("1"), Decimal("-1")], type=PRICE_TYPE),
+            volume=pa.array([-1, 1], type=pa.int64()),
+        )
+
+        valid, violations = validate_market_data_batch(table)
+
+        assert valid.to_pylist() == [False, False]
+        assert violations == [(0, "SCHEMA"), (0, "SYMBOL_FORMAT"), (1, "PRICE_VALIDITY")]
+
+    def test_trade_violations_collected(self):
+        """Trade-specific violations should be reported per row."""
+        table = trade_table(side=pa.array(["BUY", "HOLD"]))
+
+        valid, violations = validate_trade_data_batch(table)
+
+        assert valid.to_pylist() == [True, False]
+        assert violations == [(1, "TRADE_SPECIFIC")]
+
+
+class TestInvariantsBatch:
+    """Tests for check_monotonic_timestamps_batch."""
+
+    @pytest.mark.parametrize(
+        "offsets, expected",
+        [
+            ([], True),
+            ([0], True),
+            ([0, 10, 10, 20], True),
+            ([0, 20, 10], False),
+            ([0, None, 20], False),
+        ],
+    )
+    def test_monotonic_timestamps(self, offsets, expected):
+        """Ties pass; decreases and nulls fail."""
+        timestamps = [None if s is None else TS + timedelta(seconds=s) for s in offsets]
+        table = pa.table({"timestamp": pa.array(timestamps, type=TS_TYPE)})
+
+        assert check_monotonic_timestamps_batch(table) is expected
+
+    def test_monotonic_large_batch_across_chunks(self):
+        """A 100k-row table split into chunks should be checked across chunk boundaries."""
+        timestamps = [TS + timedelta(microseconds=i) for i in range(100_000)]
+        column = pa.chunked_array(
+            [pa.array(timestamps[:50_000], type=TS_TYPE), pa.array(timestamps[50_000:], type=TS_TYPE)]
+        )
+
+        assert check_monotonic_timestamps_batch(pa.table({"timestamp": column})) is True
+
+        timestamps[50_000], timestamps[49_999] = timestamps[49_999], timestamps[50_000]
+        column = pa.chunked_array(
+            [pa.array(timestamps[:50_000], type=TS_TYPE), pa.array(timestamps[50_000:], type=TS_TYPE)]
+        )
+
+        assert check_monotonic_timestamps_batch(pa.table({"timestamp": column})) is False
+
+    def test_missing_column_rejected(self):
+        """Missing timestamp columns should be reported as REQUIRED_FIELDS."""
+        with pytest.raises(ValueError, match="REQUIRED_FIELDS"):
+            check_monotonic_timestamps_batch(market_table().drop_columns(["timestamp"]))